@@ -27,7 +27,6 @@ but now exist are automatically recovered (missing flag removed).
 """
 
 import argparse
-import json
 import sys
 
 import json5
@@ -35,16 +34,26 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from .plex_api import (
+    fetch_plex_metadata,
     find_playlist,
     get_playlist_tracks,
+    load_json_file,
     load_plex_config,
     plex_request,
     resolve_path,
     resolve_plex_credentials,
     test_plex_connection,
+    write_json_file,
 )
 
 
+# Number of ratingKeys looked up per /library/metadata request
+CHECK_BATCH_SIZE = 100
+
+# Number of buffered progress lines written to stdout at once
+PROGRESS_FLUSH_SIZE = 100
+
+
 def check_mapping_against_plex(
     server_url: str,
     token: str,
@@ -55,15 +64,15 @@ def check_mapping_against_plex(
 ) -> tuple[int, int]:
     """Check that all rating keys in a mapping file still exist in Plex.
 
-    Uses parallel requests for speed.
+    Looks up keys in batches of CHECK_BATCH_SIZE per request, with batches
+    processed in parallel.
     Returns (total_checked, missing_count).
     """
     if not mapping_path.exists():
         print(f"Error: Mapping file not found: {mapping_path}")
         return 0, 0
 
-    with open(mapping_path, "r", encoding="utf-8") as f:
-        mapping = json5.load(f)
+    mapping = load_json_file(mapping_path)
 
     # Report unmatched entries (null values)
     unmatched = [card_id for card_id, entry in mapping.items() if entry is None]
@@ -96,31 +105,68 @@ def check_mapping_against_plex(
 
         return card_id, rating_key, artist, title, exists
 
+    def check_batch(batch: list[tuple[str, dict]]) -> list[tuple[str, str, str, str, bool]]:
+        """Check a batch of tracks with a single request. Returns one check_track-style tuple per track."""
+        try:
+            existing = fetch_plex_metadata(
+                server_url, token, [str(entry["ratingKey"]) for _, entry in batch]
+            )
+        except Exception:
+            existing = {}
+
+        # Fall back to one request per track if the batch lookup failed or found nothing,
+        # so a bad batch response never marks a whole batch as missing
+        if not existing:
+            return [check_track(card_id, entry) for card_id, entry in batch]
+
+        return [
+            (
+                card_id,
+                entry.get("ratingKey"),
+                entry.get("artist", "Unknown"),
+                entry.get("title", "Unknown"),
+                str(entry["ratingKey"]) in existing,
+            )
+            for card_id, entry in batch
+        ]
+
+    batches = [
+        entries_with_keys[i:i + CHECK_BATCH_SIZE]
+        for i in range(0, total, CHECK_BATCH_SIZE)
+    ]
+
     missing = []
     completed = 0
+    progress_lines = []
 
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {
-            executor.submit(check_track, card_id, entry): (card_id, entry)
-            for card_id, entry in entries_with_keys
-        }
+        futures = [executor.submit(check_batch, batch) for batch in batches]
 
         for future in as_completed(futures):
-            card_id, rating_key, artist, title, exists = future.result()
-            completed += 1
+            for card_id, rating_key, artist, title, exists in future.result():
+                completed += 1
 
-            if debug:
-                status = "OK" if exists else "MISSING"
-                print(f"  [{completed}/{total}] {rating_key}: {artist} - {title}... {status}")
+                if debug:
+                    status = "OK" if exists else "MISSING"
+                    progress_lines.append(f"  [{completed}/{total}] {rating_key}: {artist} - {title}... {status}")
 
-            if not exists:
-                missing.append((card_id, rating_key, artist, title))
+                if not exists:
+                    missing.append((card_id, rating_key, artist, title))
+
+            if len(progress_lines) >= PROGRESS_FLUSH_SIZE:
+                print("\n".join(progress_lines), flush=True)
+                progress_lines.clear()
+
+    if progress_lines:
+        print("\n".join(progress_lines))
 
     # Check for tracks that were previously missing but now exist
-    recovered = []
-    for card_id, entry in entries_with_keys:
-        if entry.get("missing") and (card_id, entry.get("ratingKey"), entry.get("artist"), entry.get("title")) not in [(m[0], m[1], m[2], m[3]) for m in missing]:
-            recovered.append(card_id)
+    missing_card_ids = {card_id for card_id, _, _, _ in missing}
+    recovered = [
+        card_id
+        for card_id, entry in entries_with_keys
+        if entry.get("missing") and card_id not in missing_card_ids
+    ]
 
     # Track if we need to save
     needs_save = False
@@ -148,8 +194,7 @@ def check_mapping_against_plex(
 
     # Save once if any changes were made
     if needs_save:
-        with open(mapping_path, "w", encoding="utf-8") as f:
-            json.dump(mapping, f, indent=2)
+        write_json_file(mapping_path, mapping)
 
     return total, len(missing) + len(unmatched)
 
@@ -165,8 +210,7 @@ def check_mapping_against_playlist(
         print(f"Error: Mapping file not found: {mapping_path}")
         return 0, 0
 
-    with open(mapping_path, "r", encoding="utf-8") as f:
-        mapping = json5.load(f)
+    mapping = load_json_file(mapping_path)
 
     mapping_keys = {
         track["ratingKey"]: (card_id, track)
@@ -20,9 +20,7 @@ import sys
 from difflib import SequenceMatcher
 from pathlib import Path
 
-import json5
-
-from .plex_api import load_plex_config, normalize_for_comparison
+from .plex_api import load_json_file, load_plex_config, normalize_for_comparison
 
 
 # Similarity threshold below which we warn about artist/title differences
@@ -186,8 +184,7 @@ def main():
     print(f"CSV:  {csv_path}")
     print()
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        mapping = json5.load(f)
+    mapping = load_json_file(json_path)
 
     csv_entries = parse_csv(csv_path)
 
@@ -19,7 +19,13 @@ from pathlib import Path
 
 import json5
 
-from .plex_api import create_playlist, load_plex_config, resolve_plex_credentials
+from .plex_api import (
+    create_playlist,
+    get_machine_identifier,
+    load_json_file,
+    load_plex_config,
+    resolve_plex_credentials,
+)
 
 
 def load_game_registry(config: dict) -> dict[str, dict]:
@@ -46,15 +52,22 @@ def load_game_registry(config: dict) -> dict[str, dict]:
 
 
 def create_playlist_from_mapping(
-    server_url: str, token: str, mapping_path: Path, playlist_name: str, debug: bool = False
+    server_url: str,
+    token: str,
+    mapping_path: Path,
+    playlist_name: str,
+    debug: bool = False,
+    machine_id: str = None,
 ) -> bool:
-    """Load a mapping file and create a Plex playlist from it. Returns True on success."""
+    """Load a mapping file and create a Plex playlist from it. Returns True on success.
+
+    Pass machine_id when creating several playlists to avoid fetching it for each one.
+    """
     if not mapping_path.exists():
         print(f"  Error: File not found: {mapping_path}")
         return False
 
-    with open(mapping_path, "r", encoding="utf-8") as f:
-        mapping = json5.load(f)
+    mapping = load_json_file(mapping_path)
 
     rating_keys = []
     for entry in mapping.values():
@@ -72,6 +85,7 @@ def create_playlist_from_mapping(
         token=token,
         title=playlist_name,
         rating_keys=rating_keys,
+        machine_id=machine_id,
         debug=debug
     )
 
@@ -160,6 +174,12 @@ def main():
             print("No entries with 'playlist' property found in game-registry.json")
             sys.exit(1)
 
+        # The machine identifier is the same for every playlist, so fetch it once
+        machine_id = get_machine_identifier(server_url, args.token, args.debug)
+        if not machine_id:
+            print("Error: Could not get server machine identifier")
+            sys.exit(1)
+
         print(f"Creating {len(entries_with_playlist)} playlists from game-registry.json\n")
 
         created = 0
@@ -167,7 +187,9 @@ def main():
             mapping_path = files_path / f"plex-mapping-{mapping_id}.json"
             playlist_name = info["playlist"]
             print(f"[{mapping_id}]")
-            if create_playlist_from_mapping(server_url, args.token, mapping_path, playlist_name, args.debug):
+            if create_playlist_from_mapping(
+                server_url, args.token, mapping_path, playlist_name, args.debug, machine_id
+            ):
                 created += 1
             print()
 
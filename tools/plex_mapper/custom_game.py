@@ -12,7 +12,6 @@ Usage:
 
 import argparse
 import hashlib
-import json
 import os
 import re
 import sys
@@ -31,12 +30,14 @@ from reportlab.lib.units import cm
 from reportlab.pdfgen import canvas
 
 from .plex_api import (
-    fetch_plex_track,
+    fetch_plex_tracks,
     find_playlist,
     get_playlist_tracks,
     list_plex_playlists,
+    load_json_file,
     load_track_remapper,
     resolve_plex_credentials,
+    write_json_file,
 )
 
 
@@ -77,6 +78,9 @@ def parse_args():
     parser.add_argument(
         "--icon", help="Path or URL to icon to embed in QR codes (max 300x300px, transparent background)"
     )
+    parser.add_argument(
+        "--workers", "-w", type=int, default=8, help="Number of parallel Plex requests (default: 8)"
+    )
     parser.add_argument(
         "--debug", "-d", action="store_true", help="Enable debug output"
     )
@@ -290,9 +294,6 @@ def main():
     # Resolve Plex credentials from config file if not provided
     resolve_plex_credentials(args)
 
-    # Load track remapper from config path
-    load_track_remapper(args.remapper_path)
-
     # Normalize server URL
     server_url = args.server.rstrip("/")
 
@@ -310,6 +311,9 @@ def main():
             print(f"{pl['ratingKey']:<12} {pl['leafCount']:<8} {pl['title']}")
         sys.exit(0)
 
+    # Load track remapper from config path (only needed once tracks are fetched)
+    load_track_remapper(args.remapper_path)
+
     # Handle extend mode vs create mode
     existing_mapping = {}
     existing_tracks = []
@@ -323,8 +327,7 @@ def main():
             sys.exit(1)
 
         # Load existing mapping
-        with open(extend_path, "r", encoding="utf-8") as f:
-            existing_mapping = json5.load(f)
+        existing_mapping = load_json_file(extend_path)
 
         # Extract mapping_id from filename (e.g., plex-mapping-de-custom.json -> de-custom)
         filename = extend_path.name
@@ -416,10 +419,12 @@ def main():
     new_tracks = []
     skipped = 0
 
+    # Debug output is printed while fetching, so fetch one key at a time to keep it in order
+    workers = 1 if args.debug else args.workers
+    tracks = fetch_plex_tracks(server_url, args.token, keys, workers, args.debug)
     for i, key in enumerate(keys):
         print(f"[{i + 1}/{len(keys)}] Fetching key {key}... ", end="", flush=True)
-
-        track = fetch_plex_track(server_url, args.token, key, args.debug)
+        track = next(tracks)
 
         if track:
             # Use rating key as both key and ratingKey value
@@ -449,8 +454,7 @@ def main():
     else:
         mapping_path = args.files_path / f"plex-mapping-{mapping_id}.json"
 
-    with open(mapping_path, "w", encoding="utf-8") as f:
-        json.dump(final_mapping, f, indent=2)
+    write_json_file(mapping_path, final_mapping)
 
     print(f"\nMapping saved to: {mapping_path}")
 
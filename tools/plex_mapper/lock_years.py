@@ -17,21 +17,17 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
-import json5
-
-from .plex_api import load_plex_config, resolve_path
+from .plex_api import load_json_file, load_plex_config, resolve_path, write_remapper_file
 
 
 def lock_years(mapping: dict, remapper_path: Path, dry_run: bool = False) -> None:
     """Write all mapping years into plex-remapper.json."""
     # Load existing remapper
     if remapper_path.exists():
-        with open(remapper_path, "r", encoding="utf-8") as f:
-            remapper = json5.load(f)
+        remapper = load_json_file(remapper_path)
         print(f"Loaded {len(remapper)} existing entries from {remapper_path.name}")
     else:
         remapper = []
@@ -108,9 +104,7 @@ def lock_years(mapping: dict, remapper_path: Path, dry_run: bool = False) -> Non
 
     # Save
     if not dry_run:
-        with open(remapper_path, "w", encoding="utf-8") as f:
-            json.dump(remapper, f, indent=4, ensure_ascii=False)
-            f.write("\n")
+        write_remapper_file(remapper_path, remapper)
 
     prefix = "[DRY RUN] " if dry_run else ""
     print(f"\n{prefix}Lock years complete:")
@@ -169,8 +163,7 @@ def main():
 
     # Load mapping
     print(f"Mapping: {mapping_path}")
-    with open(mapping_path, "r", encoding="utf-8") as f:
-        mapping = json5.load(f)
+    mapping = load_json_file(mapping_path)
 
     matched = sum(1 for v in mapping.values() if v is not None)
     print(f"Entries: {len(mapping)} ({matched} matched)")
@@ -13,27 +13,23 @@ Usage:
 
 import argparse
 import csv
-import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 from urllib.parse import quote
 
-import json5
-import requests
-
 from .plex_api import (
-    load_plex_config,
+    build_plex_track,
     plex_request,
     fetch_plex_track,
-    get_remapped_year,
-    get_remapped_artist,
-    get_remapped_title,
-    extract_guids,
+    load_json_file,
     load_track_remapper,
     normalize_for_comparison,
     resolve_plex_credentials,
     test_plex_connection,
+    write_json_file,
 )
 
 
@@ -62,6 +58,9 @@ def parse_args():
     parser.add_argument(
         "--download-dir", help="Directory to save downloaded songs (default: ./downloads)"
     )
+    parser.add_argument(
+        "--download-workers", type=int, default=4, help="Number of parallel downloads (default: 4)"
+    )
     parser.add_argument(
         "--cookies", help="Path to cookies.txt file or browser name (chrome, firefox, edge) for YouTube auth"
     )
@@ -116,7 +115,13 @@ def search_plex(server_url: str, token: str, artist: str, title: str, expected_y
     # Remove duplicates while preserving order
     search_queries = list(dict.fromkeys(search_queries))
 
-    best_match = None
+    # Normalize the search terms once; only the candidate fields vary per result
+    norm_title = normalize_for_comparison(title)
+    norm_clean_title = normalize_for_comparison(clean_title)
+    norm_artist = normalize_for_comparison(artist)
+    norm_clean_artist = normalize_for_comparison(clean_artist)
+
+    best_track = None
     best_year_diff = float("inf")
 
     for query in search_queries:
@@ -134,28 +139,27 @@ def search_plex(server_url: str, token: str, artist: str, title: str, expected_y
             metadata = response.get("MediaContainer", {}).get("Metadata", [])
 
             for track in metadata:
-                track_title = (track.get("title") or "").lower()
-                track_artist = (track.get("grandparentTitle") or track.get("originalTitle") or "").lower()
+                # Bind candidate fields once (each is used several times below)
+                plex_title = track.get("title")
+                plex_artist = track.get("grandparentTitle") or track.get("originalTitle")
                 track_year = track.get("parentYear") or track.get("year")
 
                 if debug:
-                    print(f"  DEBUG: Checking: \"{track.get('title')}\" by \"{track.get('grandparentTitle') or track.get('originalTitle')}\" ({track_year})")
+                    print(f"  DEBUG: Checking: \"{plex_title}\" by \"{plex_artist}\" ({track_year})")
 
                 # Check if this is a reasonable match (using normalized comparison)
-                # Compare against both original and cleaned versions
-                norm_title = normalize_for_comparison(title)
-                norm_clean_title = normalize_for_comparison(clean_title)
-                norm_track_title = normalize_for_comparison(track_title)
-                norm_artist = normalize_for_comparison(artist)
-                norm_clean_artist = normalize_for_comparison(clean_artist)
-                norm_track_artist = normalize_for_comparison(track_artist)
-
+                # Compare against both original and cleaned versions (normalization lowercases)
+                norm_track_title = normalize_for_comparison(plex_title or "")
                 title_match = (
                     norm_title in norm_track_title or
                     norm_track_title in norm_title or
                     norm_clean_title in norm_track_title or
                     norm_track_title in norm_clean_title
                 )
+                if not title_match:
+                    continue
+
+                norm_track_artist = normalize_for_comparison(plex_artist or "")
                 artist_match = (
                     norm_artist in norm_track_artist or
                     norm_track_artist in norm_artist or
@@ -163,66 +167,46 @@ def search_plex(server_url: str, token: str, artist: str, title: str, expected_y
                     norm_track_artist in norm_clean_artist
                 )
 
-                if title_match and artist_match:
+                if artist_match:
                     year_diff = abs((track_year or 0) - expected_year)
 
                     if debug:
                         print(f"  DEBUG: Match found! Year diff: {year_diff} (track: {track_year}, expected: {expected_year})")
 
+                    # Only remember the candidate here; the match dict is built once for the winner
                     if year_diff < best_year_diff:
                         best_year_diff = year_diff
-                        media = track.get("Media", [{}])[0]
-                        parts = media.get("Part", [{}])[0]
-                        rating_key = track.get("ratingKey")
-                        plex_artist = track.get("grandparentTitle") or track.get("originalTitle")
-                        plex_title = track.get("title")
-                        remapped_year = get_remapped_year(rating_key, track_year)
-                        remapped_artist = get_remapped_artist(rating_key, plex_artist)
-                        remapped_title = get_remapped_title(rating_key, plex_title)
-                        if debug and remapped_year != track_year:
-                            print(f"  DEBUG: Year remapped from {track_year} to {remapped_year}")
-                        if debug and remapped_artist != plex_artist:
-                            print(f"  DEBUG: Artist remapped from {plex_artist} to {remapped_artist}")
-                        if debug and remapped_title != plex_title:
-                            print(f"  DEBUG: Title remapped from {plex_title} to {remapped_title}")
-
-                        # Extract stable identifiers (guid, mbid)
-                        plex_guid, mbid = extract_guids(track)
-
-                        best_match = {
-                            "ratingKey": rating_key,
-                            "title": remapped_title,
-                            "artist": remapped_artist,
-                            "album": track.get("parentTitle"),
-                            "year": remapped_year,
-                            "duration": track.get("duration"),
-                            "partKey": parts.get("key"),
-                        }
-
-                        # Add stable identifiers if available
-                        if plex_guid:
-                            best_match["guid"] = plex_guid
-                        if mbid:
-                            best_match["mbid"] = mbid
-
+                        best_track = track
                         # If exact year match, we're done searching
                         if year_diff == 0:
-                            if debug:
-                                print("  DEBUG: Exact year match!")
-                                if plex_guid:
-                                    print(f"  DEBUG: GUID: {plex_guid}")
-                                if mbid:
-                                    print(f"  DEBUG: MBID: {mbid}")
-                            return best_match
+                            break
 
         except Exception as e:
             if debug:
                 print(f"  DEBUG: Search error: {e}")
             continue
 
+        if best_year_diff == 0:
+            break
+
+    if best_track is None:
+        return None
+
+    # Same mapping entry as a direct ratingKey fetch (remapper overrides, title normalization, warnings)
+    best_match = build_plex_track(best_track, best_track.get("ratingKey"), debug)
+
+    if best_year_diff == 0:
+        if debug:
+            print("  DEBUG: Exact year match!")
+            if best_match.get("guid"):
+                print(f"  DEBUG: GUID: {best_match['guid']}")
+            if best_match.get("mbid"):
+                print(f"  DEBUG: MBID: {best_match['mbid']}")
+        return best_match
+
     # Return match if within tolerance
-    if best_match and best_year_diff <= year_tolerance:
-        if debug and best_year_diff > 0:
+    if best_year_diff <= year_tolerance:
+        if debug:
             print(f"  DEBUG: Accepting match within tolerance (diff: {best_year_diff}, tolerance: {year_tolerance})")
             if best_match.get("guid"):
                 print(f"  DEBUG: GUID: {best_match['guid']}")
@@ -230,7 +214,7 @@ def search_plex(server_url: str, token: str, artist: str, title: str, expected_y
                 print(f"  DEBUG: MBID: {best_match['mbid']}")
         return best_match
 
-    if debug and best_match:
+    if debug:
         print(f"  DEBUG: Rejecting match - year mismatch ({best_match['year']} vs expected {expected_year}, diff: {best_year_diff}, tolerance: {year_tolerance})")
 
     return None
@@ -238,18 +222,23 @@ def search_plex(server_url: str, token: str, artist: str, title: str, expected_y
 
 def parse_csv(csv_path: str) -> tuple[list[str], list[list[str]]]:
     """Parse CSV file and return headers and rows."""
-    with open(csv_path, "r", encoding="utf-8") as f:
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
         reader = csv.reader(f)
-        rows = list(reader)
-    # Skip Excel's sep= directive if present
-    if rows and rows[0] and rows[0][0].lower().startswith("sep="):
-        rows = rows[1:]
-    # Filter out empty rows
-    headers = rows[0]
-    data_rows = [row for row in rows[1:] if row and len(row) >= len(headers)]
+        headers = next(reader, [])
+        # Skip Excel's sep= directive if present
+        if headers and headers[0].lower().startswith("sep="):
+            headers = next(reader, [])
+        # Filter out empty rows while reading (no intermediate list of all rows)
+        min_columns = len(headers)
+        data_rows = [row for row in reader if row and len(row) >= min_columns]
     return headers, data_rows
 
 
+def sanitize_filename(name: str) -> str:
+    """Remove characters that are invalid in file and folder names."""
+    return re.sub(r'[<>:"/\\|?*]', "", name).strip()
+
+
 def download_song(url: str, artist: str, title: str, year: str, output_dir: Path, cookies: str = None, debug: bool = False) -> bool:
     """Download a song from YouTube with proper metadata."""
     try:
@@ -259,8 +248,8 @@ def download_song(url: str, artist: str, title: str, year: str, output_dir: Path
         return False
 
     # Sanitize names for filesystem (remove invalid characters)
-    safe_artist = re.sub(r'[<>:"/\\|?*]', "", artist).strip()
-    safe_title = re.sub(r'[<>:"/\\|?*]', "", title).strip()
+    safe_artist = sanitize_filename(artist)
+    safe_title = sanitize_filename(title)
 
     # Create Plex-friendly folder structure: artist/album/song (using song title as album for singles)
     song_dir = output_dir / safe_artist / safe_title
@@ -386,7 +375,9 @@ def main():
         print(f"Found headers: {headers}")
         sys.exit(1)
 
-    url_idx = headers.index("URL") if "URL" in headers else -1
+    # Build row accessors once instead of indexing each field per row
+    get_song_fields = itemgetter(card_idx, artist_idx, title_idx, year_idx)
+    get_url = itemgetter(headers.index("URL")) if "URL" in headers else lambda row: ""
 
     # Test Plex connection and search API
     test_plex_connection(server_url, args.token, test_search=True)
@@ -395,11 +386,10 @@ def main():
     existing_mapping = {}
     if (args.id or not args.rematch) and output_path.exists():
         try:
-            with open(output_path, "r", encoding="utf-8") as f:
-                existing_mapping = json5.load(f)
+            existing_mapping = load_json_file(output_path)
             matched_count = sum(1 for v in existing_mapping.values() if v is not None)
             print(f"\nLoaded existing mapping: {matched_count} matched, {len(existing_mapping) - matched_count} unmatched")
-        except (json5.JSON5DecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             print(f"Warning: Could not load existing mapping: {e}")
 
     # Process each song
@@ -425,8 +415,7 @@ def main():
                 mapping[args.id] = plex_track
                 print(f"SUCCESS: {plex_track['artist']} - {plex_track['title']} ({plex_track['year']})")
                 # Write output and exit early
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(mapping, f, indent=2)
+                write_json_file(output_path, mapping)
                 print(f"\nMapping saved to: {output_path}")
                 return
             else:
@@ -441,15 +430,18 @@ def main():
     else:
         print(f"\nProcessing {len(songs)} songs...\n")
 
+    # Card IDs that already have a match and can be skipped (unless rematching or specific ID)
+    if args.id or args.rematch:
+        matched_ids = frozenset()
+    else:
+        matched_ids = frozenset(k for k, v in existing_mapping.items() if v is not None)
+
     for i, row in enumerate(songs):
-        card_id = row[card_idx]
-        artist = row[artist_idx]
-        title = row[title_idx]
-        year = row[year_idx]
-        url = row[url_idx] if url_idx >= 0 else ""
-
-        # Skip already matched songs (unless rematching or specific ID)
-        if not args.id and not args.rematch and card_id in existing_mapping and existing_mapping[card_id] is not None:
+        card_id, artist, title, year = get_song_fields(row)
+        url = get_url(row)
+
+        # Skip already matched songs
+        if card_id in matched_ids:
             if args.debug:
                 print(f"[{i + 1}/{len(songs)}] Skipping (already matched): {artist} - {title}")
             skipped += 1
@@ -491,8 +483,7 @@ def main():
             })
 
     # Write output
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(mapping, f, indent=2)
+    write_json_file(output_path, mapping)
 
     # Download missing songs if requested
     if args.download and missing_songs:
@@ -500,36 +491,52 @@ def main():
         download_dir.mkdir(parents=True, exist_ok=True)
 
         print(f"\n{'=' * 40}")
-        print(f"Downloading {len(missing_songs)} missing songs to: {download_dir}")
+        print(f"Downloading {len(missing_songs)} missing songs to: {download_dir} ({args.download_workers} parallel)")
         print("=" * 40 + "\n")
 
         downloaded = 0
-        skipped = 0
+        download_skipped = 0
         failed = 0
+        completed = 0
+        total = len(missing_songs)
 
-        for i, song in enumerate(missing_songs):
-            progress = f"[{i + 1}/{len(missing_songs)}]"
-            song_info = f"{song['artist']} - {song['title']} ({song['year']})"
-
+        # Songs sharing a target folder go to the same worker and run one after another,
+        # since download_song cleans up temp files in that folder
+        song_groups: dict[tuple[str, str], list[dict]] = {}
+        for song in missing_songs:
             if not song["url"]:
-                print(f"{progress} {song_info} - SKIPPED (no URL)")
+                completed += 1
+                print(f"[{completed}/{total}] {song['artist']} - {song['title']} ({song['year']}) - SKIPPED (no URL)")
                 failed += 1
                 continue
-
-            print(f"{progress} Downloading: {song_info}")
-
-            result = download_song(song["url"], song["artist"], song["title"], song["year"], download_dir, args.cookies, args.debug)
-            if result is None:
-                print(f"  -> SKIPPED (already exists)")
-                skipped += 1
-            elif result:
-                print(f"  -> DOWNLOADED")
-                downloaded += 1
-            else:
-                print(f"  -> FAILED")
-                failed += 1
-
-        print(f"\nDownload complete: {downloaded} succeeded, {skipped} skipped, {failed} failed")
+            group_key = (sanitize_filename(song["artist"]).lower(), sanitize_filename(song["title"]).lower())
+            song_groups.setdefault(group_key, []).append(song)
+
+        def download_group(songs: list[dict]) -> list[tuple[dict, bool | None]]:
+            return [
+                (song, download_song(song["url"], song["artist"], song["title"], song["year"], download_dir, args.cookies, args.debug))
+                for song in songs
+            ]
+
+        with ThreadPoolExecutor(max_workers=max(1, args.download_workers)) as executor:
+            futures = [executor.submit(download_group, songs) for songs in song_groups.values()]
+
+            for future in as_completed(futures):
+                for song, result in future.result():
+                    completed += 1
+                    progress = f"[{completed}/{total}]"
+                    song_info = f"{song['artist']} - {song['title']} ({song['year']})"
+                    if result is None:
+                        print(f"{progress} {song_info} - SKIPPED (already exists)")
+                        download_skipped += 1
+                    elif result:
+                        print(f"{progress} {song_info} - DOWNLOADED")
+                        downloaded += 1
+                    else:
+                        print(f"{progress} {song_info} - FAILED")
+                        failed += 1
+
+        print(f"\nDownload complete: {downloaded} succeeded, {download_skipped} skipped, {failed} failed")
         print(f"Files saved to: {download_dir.resolve()}")
 
     # Print summary
@@ -15,12 +15,13 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
 import json5
 
-from .plex_api import load_plex_config
+from .plex_api import load_json_file, load_plex_config
 
 
 def load_game_registry(registry_path: Path) -> dict[str, dict]:
@@ -59,8 +60,7 @@ def calculate_mapping_stats(mapping_path: Path) -> dict | None:
     Returns None if file cannot be read.
     """
     try:
-        with open(mapping_path, "r", encoding="utf-8") as f:
-            mapping = json5.load(f)
+        mapping = load_json_file(mapping_path)
 
         total = len(mapping)
         matched = sum(1 for v in mapping.values() if v is not None)
@@ -76,11 +76,25 @@ def calculate_mapping_stats(mapping_path: Path) -> dict | None:
             "minDate": min(years) if years else None,
             "maxDate": max(years) if years else None,
         }
-    except (json.JSONDecodeError, IOError) as e:
+    except (ValueError, IOError) as e:
         print(f"  Warning: Could not read {mapping_path.name}: {e}")
         return None
 
 
+def list_mapping_files(scan_dir: Path) -> set[str]:
+    """Return the names of all plex-mapping-*.json files in scan_dir (single directory scan)."""
+    try:
+        with os.scandir(scan_dir) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if entry.name.startswith("plex-mapping-") and entry.name.endswith(".json") and entry.is_file()
+            }
+    except OSError as e:
+        print(f"Warning: Could not scan directory {scan_dir}: {e}")
+        return set()
+
+
 def generate_manifest(scan_dir: Path, game_registry: dict[str, str], debug: bool = False) -> dict:
     """Generate manifest from mapping files based on game-registry.json.
 
@@ -99,12 +113,13 @@ def generate_manifest(scan_dir: Path, game_registry: dict[str, str], debug: bool
         print(f"Game name mappings: {len(game_registry)}")
 
     games_list = []
+    mapping_files = list_mapping_files(scan_dir)
 
     for mapping_id, game_info in game_registry.items():
         game_name = game_info["name"]
         mapping_path = scan_dir / f"plex-mapping-{mapping_id}.json"
 
-        if not mapping_path.exists():
+        if mapping_path.name not in mapping_files:
             if debug:
                 print(f"  {mapping_id}: MISSING (file not found)")
             continue
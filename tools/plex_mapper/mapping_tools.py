@@ -13,7 +13,6 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
@@ -21,12 +20,34 @@ from pathlib import Path
 import json5
 
 from .plex_api import (
+    build_plex_track,
+    fetch_plex_metadata,
     fetch_plex_track,
+    load_json_file,
     load_plex_config,
     load_track_remapper,
     resolve_path,
     resolve_plex_credentials,
     test_plex_connection,
+    write_json_file,
+)
+
+
+# Number of ratingKeys fetched per /library/metadata request
+ENRICH_BATCH_SIZE = 100
+
+# Number of buffered progress lines written to stdout at once
+PROGRESS_FLUSH_SIZE = 100
+
+# Fields reported as enrich changes: (field, only report when newly added, change label)
+_ENRICH_DIFF_FIELDS = (
+    ("guid", True, "guid"),
+    ("mbid", True, "mbid"),
+    ("alternativeKeys", True, "alternativeKeys: {new}"),
+    ("year", False, "year:{old}->{new}"),
+    ("artist", False, "artist"),
+    ("title", False, "title"),
+    ("partKey", False, "partKey"),
 )
 
 
@@ -46,8 +67,7 @@ def enrich_mapping(
         print(f"Error: Mapping file not found: {mapping_path}")
         sys.exit(1)
 
-    with open(mapping_path, "r", encoding="utf-8") as f:
-        mapping = json5.load(f)
+    mapping = load_json_file(mapping_path)
 
     # Report unmatched entries (null values)
     unmatched = [card_id for card_id, entry in mapping.items() if entry is None]
@@ -68,76 +88,108 @@ def enrich_mapping(
     missing = 0
     unchanged = 0
     recovered = 0
+    dirty = False  # Only rewrite the file if any entry actually changed
 
-    def fetch_track(card_id: str, entry: dict) -> tuple[str, dict | None, dict, list[str]]:
-        """Fetch a single track and return (card_id, new_track, old_entry, changes)."""
-        rating_key = entry.get("ratingKey")
-        new_track = fetch_plex_track(server_url, token, rating_key, debug=False)
-
+    def compare_track(card_id: str, entry: dict, new_track: dict | None) -> tuple[str, dict | None, dict, list[str]]:
+        """Compare a fetched track with its entry and return (card_id, new_track, old_entry, changes)."""
         changes = []
-        if new_track:
-            if new_track.get("guid") and not entry.get("guid"):
-                changes.append("guid")
-            if new_track.get("mbid") and not entry.get("mbid"):
-                changes.append("mbid")
-            if new_track.get("alternativeKeys") and not entry.get("alternativeKeys"):
-                changes.append(f"alternativeKeys: {new_track['alternativeKeys']}")
-            if new_track.get("year") != entry.get("year"):
-                changes.append(f"year:{entry.get('year')}->{new_track.get('year')}")
-            if new_track.get("artist") != entry.get("artist"):
-                changes.append("artist")
-            if new_track.get("title") != entry.get("title"):
-                changes.append("title")
-            if new_track.get("partKey") != entry.get("partKey"):
-                changes.append("partKey")
+        # An identical entry has no changes; one C-level dict comparison covers the common re-run case
+        if new_track and new_track != entry:
+            for field, only_if_missing, label in _ENRICH_DIFF_FIELDS:
+                new_value = new_track.get(field)
+                old_value = entry.get(field)
+                if (new_value and not old_value) if only_if_missing else (new_value != old_value):
+                    changes.append(label.format(old=old_value, new=new_value))
 
         return card_id, new_track, entry, changes
 
-    # Process tracks in parallel
+    # Cards that share a ratingKey are fetched once and the result is compared against each of them
+    cards_by_key: dict[str, list[tuple[str, dict]]] = {}
+    for card_id, entry in entries_with_keys:
+        cards_by_key.setdefault(entry["ratingKey"], []).append((card_id, entry))
+    rating_keys = list(cards_by_key)
+
+    def fetch_batch(keys: list[str]) -> list[tuple[str, dict | None, dict, list[str]]]:
+        """Fetch a batch of ratingKeys with a single request. Returns one compare_track tuple per card."""
+        try:
+            metadata = fetch_plex_metadata(server_url, token, [str(key) for key in keys])
+        except Exception:
+            metadata = {}
+
+        if metadata:
+            new_tracks = {}
+            for key in keys:
+                track = metadata.get(str(key))
+                new_tracks[key] = build_plex_track(track, key) if track else None
+        else:
+            # Fall back to one request per track if the batch lookup failed or found nothing,
+            # so a bad batch response never reports a whole batch as missing
+            new_tracks = {key: fetch_plex_track(server_url, token, key, debug=False) for key in keys}
+
+        return [
+            compare_track(card_id, entry, new_tracks[key])
+            for key in keys
+            for card_id, entry in cards_by_key[key]
+        ]
+
+    def describe(entry: dict) -> str:
+        """Format "artist - title" for progress output (only built for lines that are printed)."""
+        return f"{entry.get('artist', 'Unknown')} - {entry.get('title', 'Unknown')}"
+
+    batches = [
+        rating_keys[i:i + ENRICH_BATCH_SIZE]
+        for i in range(0, len(rating_keys), ENRICH_BATCH_SIZE)
+    ]
+
+    # Process batches in parallel
     completed = 0
+    progress_lines = []
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {
-            executor.submit(fetch_track, card_id, entry): (card_id, entry)
-            for card_id, entry in entries_with_keys
-        }
+        futures = [executor.submit(fetch_batch, batch) for batch in batches]
 
         for future in as_completed(futures):
-            card_id, new_track, old_entry, changes = future.result()
-            completed += 1
-            old_artist = old_entry.get("artist", "Unknown")
-            old_title = old_entry.get("title", "Unknown")
-            rating_key = old_entry.get("ratingKey")
-
-            if new_track:
-                # Remove missing flag if track was previously marked as missing
-                was_missing = old_entry.get("missing", False)
-                mapping[card_id] = new_track
-                if was_missing:
-                    recovered += 1
-                    changes.append("recovered (was missing)")
-                if changes:
-                    enriched += 1
-                    if debug:
-                        print(
-                            f"[{completed}/{total}] {old_artist} - {old_title}: UPDATED ({', '.join(changes)})"
-                        )
+            for card_id, new_track, old_entry, changes in future.result():
+                completed += 1
+
+                if new_track:
+                    # Remove missing flag if track was previously marked as missing
+                    was_missing = old_entry.get("missing", False)
+                    if new_track != old_entry:
+                        mapping[card_id] = new_track
+                        dirty = True
+                    if was_missing:
+                        recovered += 1
+                        changes.append("recovered (was missing)")
+                    if changes:
+                        enriched += 1
+                        if debug:
+                            progress_lines.append(
+                                f"[{completed}/{total}] {describe(old_entry)}: UPDATED ({', '.join(changes)})"
+                            )
+                        else:
+                            progress_lines.append(
+                                f"[{completed}/{total}] UPDATED: {describe(old_entry)} ({', '.join(changes)})"
+                            )
                     else:
-                        print(
-                            f"[{completed}/{total}] UPDATED: {old_artist} - {old_title} ({', '.join(changes)})"
-                        )
+                        unchanged += 1
+                        if debug:
+                            progress_lines.append(f"[{completed}/{total}] {describe(old_entry)}: unchanged")
                 else:
-                    unchanged += 1
-                    if debug:
-                        print(f"[{completed}/{total}] {old_artist} - {old_title}: unchanged")
-            else:
-                missing += 1
-                print(
-                    f"[{completed}/{total}] MISSING: {old_artist} - {old_title} (ratingKey: {rating_key})"
-                )
+                    missing += 1
+                    progress_lines.append(
+                        f"[{completed}/{total}] MISSING: {describe(old_entry)} (ratingKey: {old_entry.get('ratingKey')})"
+                    )
+
+            if len(progress_lines) >= PROGRESS_FLUSH_SIZE:
+                print("\n".join(progress_lines), flush=True)
+                progress_lines.clear()
+
+    if progress_lines:
+        print("\n".join(progress_lines))
 
     # Write updated mapping
-    with open(mapping_path, "w", encoding="utf-8") as f:
-        json.dump(mapping, f, indent=2)
+    if dirty:
+        write_json_file(mapping_path, mapping)
 
     # Summary
     print(f"\n{'=' * 50}")
@@ -147,7 +199,10 @@ def enrich_mapping(
     print(f"  Missing:   {missing}")
     if recovered > 0:
         print(f"  Recovered: {recovered} (previously missing, now found)")
-    print(f"\nMapping saved to: {mapping_path}")
+    if dirty:
+        print(f"\nMapping saved to: {mapping_path}")
+    else:
+        print(f"\nNo changes, mapping not rewritten: {mapping_path}")
     print("=" * 50)
     if enriched > 0:
         print("\nHint: Run 'poetry run update-manifest' to update the manifest.")
@@ -6,14 +6,36 @@ used by both plex-mapper and custom-game tools.
 """
 
 import json
+import os
 import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import json5
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
+# Punctuation and whitespace dropped by normalize_for_comparison
+_COMPARISON_STRIP_RE = re.compile(r"[\s\-_'.,:;!?]+")
+
+# Accent and ligature folding for normalize_for_comparison (basic normalization)
+_ACCENT_TABLE = str.maketrans({
+    "ä": "a", "ö": "o", "ü": "u",
+    "é": "e", "è": "e", "ê": "e",
+    "á": "a", "à": "a", "â": "a",
+    "ó": "o", "ò": "o", "ô": "o",
+    "ú": "u", "ù": "u", "û": "u",
+    "ñ": "n", "ß": "ss",
+    "æ": "ae", "œ": "oe",
+})
+
+
+@lru_cache(maxsize=4096)
 def normalize_for_comparison(text: str) -> str:
     """Normalize text for fuzzy comparison by removing spaces, punctuation, and lowercasing."""
     if not text:
@@ -23,17 +45,9 @@ def normalize_for_comparison(text: str) -> str:
     # Normalize & to and (before removing spaces)
     text = text.replace(" & ", " and ").replace("&", " and ")
     # Remove common punctuation and spaces
-    text = re.sub(r"[\s\-_'.,:;!?]+", "", text)
-    # Remove accents (basic normalization)
-    text = text.replace("ä", "a").replace("ö", "o").replace("ü", "u")
-    text = text.replace("é", "e").replace("è", "e").replace("ê", "e")
-    text = text.replace("á", "a").replace("à", "a").replace("â", "a")
-    text = text.replace("ó", "o").replace("ò", "o").replace("ô", "o")
-    text = text.replace("ú", "u").replace("ù", "u").replace("û", "u")
-    text = text.replace("ñ", "n").replace("ß", "ss")
-    # Ligatures
-    text = text.replace("æ", "ae").replace("œ", "oe")
-    return text
+    text = _COMPARISON_STRIP_RE.sub("", text)
+    # Remove accents and expand ligatures in a single pass
+    return text.translate(_ACCENT_TABLE)
 
 
 def resolve_plex_credentials(args, config_attr: str = "config") -> None:
@@ -128,6 +142,10 @@ def test_plex_connection(server_url: str, token: str, test_search: bool = False)
     return container
 
 
+# Playlist lookup indexes per server: (playlists, by ratingKey, by lowercased title)
+_playlist_index: dict[str, tuple[list[dict], dict[str, dict], dict[str, dict]]] = {}
+
+
 def find_playlist(server_url: str, token: str, playlist_name_or_key: str, debug: bool = False) -> tuple[str, str, int] | None:
     """Find a playlist by name or ratingKey.
 
@@ -141,12 +159,24 @@ def find_playlist(server_url: str, token: str, playlist_name_or_key: str, debug:
         Tuple of (ratingKey, title, trackCount) if found, None otherwise.
         Prints available playlists and exits if not found.
     """
-    playlists = list_plex_playlists(server_url, token, debug)
-
-    for pl in playlists:
-        if pl['ratingKey'] == playlist_name_or_key or pl['title'].lower() == playlist_name_or_key.lower():
-            print(f"Found playlist: {pl['title']} ({pl['leafCount']} tracks)")
-            return pl['ratingKey'], pl['title'], pl['leafCount']
+    # Fetch and index the playlists once per server, so repeated lookups (e.g. checking
+    # every mapping against its playlist) are dict hits instead of /playlists requests
+    index = _playlist_index.get(server_url)
+    if index is None:
+        playlists = list_plex_playlists(server_url, token, debug)
+        by_key = {pl['ratingKey']: pl for pl in playlists}
+        by_title = {}
+        for pl in playlists:
+            by_title.setdefault((pl['title'] or "").lower(), pl)
+        index = (playlists, by_key, by_title)
+        if playlists:
+            _playlist_index[server_url] = index
+    playlists, by_key, by_title = index
+
+    pl = by_key.get(playlist_name_or_key) or by_title.get(playlist_name_or_key.lower())
+    if pl:
+        print(f"Found playlist: {pl['title']} ({pl['leafCount']} tracks)")
+        return pl['ratingKey'], pl['title'], pl['leafCount']
 
     print(f"Error: Playlist '{playlist_name_or_key}' not found")
     print("\nAvailable playlists:")
@@ -157,11 +187,13 @@ def find_playlist(server_url: str, token: str, playlist_name_or_key: str, debug:
 # Global cache for track remapper (year, artist, title overrides)
 _track_remapper: dict[str, dict] = {}
 _track_remapper_loaded = False
+# Shared empty replaceData for tracks without a remapper entry (never mutated)
+_EMPTY: dict = {}
 
 
 def load_track_remapper(remapper_path: Path = None) -> dict[str, dict]:
     """Load track remapper from JSON file. Returns dict of ratingKey -> replaceData."""
-    global _track_remapper, _track_remapper_loaded
+    global _track_remapper_loaded
 
     if _track_remapper_loaded and remapper_path is None:
         return _track_remapper
@@ -171,14 +203,22 @@ def load_track_remapper(remapper_path: Path = None) -> dict[str, dict]:
         return _track_remapper
 
     try:
-        with open(remapper_path, "r", encoding="utf-8") as f:
-            data = json5.load(f)
+        data = load_json_file(remapper_path)
 
-        # Check for duplicate ratingKeys
+        # Single pass over the entries: check for duplicate ratingKeys, validate that all
+        # ratingKeys are strings (not numbers), collect replaceData and count overrides
         seen_keys: dict[str, int] = {}  # ratingKey -> first occurrence index
         duplicates: list[tuple[str, int, int]] = []  # (ratingKey, first_index, duplicate_index)
+        non_string_keys: list[tuple[int, str, object]] = []
+        remappings: dict[str, dict] = {}
+        artist_count = year_count = title_count = ratingkey_count = 0
         for idx, entry in enumerate(data):
+            if not isinstance(entry, dict):
+                continue
             rating_key = entry.get("ratingKey")
+            replace_data = entry.get("replaceData")
+            if not isinstance(replace_data, dict):
+                replace_data = _EMPTY
             if rating_key:
                 key_str = str(rating_key)
                 if key_str in seen_keys:
@@ -186,39 +226,34 @@ def load_track_remapper(remapper_path: Path = None) -> dict[str, dict]:
                 else:
                     seen_keys[key_str] = idx
 
+            if rating_key is not None and not isinstance(rating_key, str):
+                non_string_keys.append((idx, "ratingKey", rating_key))
+            replace_key = replace_data.get("ratingKey")
+            if replace_key is not None and not isinstance(replace_key, str):
+                non_string_keys.append((idx, "replaceData.ratingKey", replace_key))
+
+            if rating_key and replace_data:
+                remappings[key_str] = replace_data
+                year_count += "year" in replace_data
+                artist_count += "artist" in replace_data
+                title_count += "title" in replace_data
+                ratingkey_count += "ratingKey" in replace_data
+
         if duplicates:
             print(f"Error: Duplicate ratingKeys found in {remapper_path.name}:")
             for key, first_idx, dup_idx in duplicates:
                 print(f"  ratingKey {key}: entries at index {first_idx} and {dup_idx}")
             sys.exit(1)
 
-        # Validate that all ratingKeys are strings (not numbers)
-        non_string_keys: list[tuple[int, str, object]] = []
-        for idx, entry in enumerate(data):
-            rating_key = entry.get("ratingKey")
-            if rating_key is not None and not isinstance(rating_key, str):
-                non_string_keys.append((idx, "ratingKey", rating_key))
-            replace_key = entry.get("replaceData", {}).get("ratingKey")
-            if replace_key is not None and not isinstance(replace_key, str):
-                non_string_keys.append((idx, "replaceData.ratingKey", replace_key))
-
         if non_string_keys:
             print(f"Error: Non-string ratingKeys found in {remapper_path.name}:")
             for idx, field, value in non_string_keys:
                 print(f"  Entry {idx}: {field} = {value} ({type(value).__name__}, should be string)")
             sys.exit(1)
 
-        for entry in data:
-            rating_key = entry.get("ratingKey")
-            replace_data = entry.get("replaceData", {})
-            if rating_key and replace_data:
-                _track_remapper[str(rating_key)] = replace_data
+        _track_remapper.update(remappings)
 
         if _track_remapper:
-            artist_count = sum(1 for e in _track_remapper.values() if "artist" in e)
-            year_count = sum(1 for e in _track_remapper.values() if "year" in e)
-            title_count = sum(1 for e in _track_remapper.values() if "title" in e)
-            ratingkey_count = sum(1 for e in _track_remapper.values() if "ratingKey" in e)
             parts = []
             if year_count:
                 parts.append(f"{year_count} year")
@@ -240,83 +275,107 @@ def load_track_remapper(remapper_path: Path = None) -> dict[str, dict]:
         return _track_remapper
 
 
-def get_remapped_year(rating_key: str, original_year: int) -> int:
-    """Get remapped year for a rating key, or return original year if not remapped."""
-    if not _track_remapper_loaded:
-        load_track_remapper()
-    entry = _track_remapper.get(str(rating_key))
-    return entry.get("year", original_year) if entry else original_year
-
-
-def get_remapped_artist(rating_key: str, original_artist: str) -> str:
-    """Get remapped artist for a rating key, or return original artist if not remapped."""
-    if not _track_remapper_loaded:
-        load_track_remapper()
-    entry = _track_remapper.get(str(rating_key))
-    return entry.get("artist", original_artist) if entry else original_artist
-
-
-def get_remapped_title(rating_key: str, original_title: str) -> str:
-    """Get remapped title for a rating key, or return original title if not remapped."""
-    if not _track_remapper_loaded:
-        load_track_remapper()
-    entry = _track_remapper.get(str(rating_key))
-    return entry.get("title", original_title) if entry else original_title
-
+def get_remap_entry(rating_key: str) -> dict:
+    """Get the remapper replaceData for a rating key (empty dict if the track is not remapped).
 
-def get_alternative_ratingkey(rating_key: str) -> str | None:
-    """Get alternative ratingKey from remapper's replaceData if one exists.
-
-    Used to support old printed cards that have a different ratingKey.
-    The alternative key is added to alternativeKeys so the website can look up
-    tracks by either the current or old ratingKey.
+    The returned dict is shared and must not be modified.
     """
-    if not _track_remapper_loaded:
-        load_track_remapper()
-    entry = _track_remapper.get(str(rating_key))
-    if entry:
-        return entry.get("ratingKey")
-    return None
-
-
-# Patterns to strip from titles (version/format info that doesn't affect song identity)
-_TITLE_STRIP_PATTERNS = [
-    r"\s*\(Extended Version\)",
-    r"\s*\(\d{4}\s*-?\s*Remaster(?:ed)?\)",
-    r"\s*\(Remaster(?:ed)?\)",
-    r"\s*\(\d+(?:st|nd|rd|th) Anniversary Edition\)",
-    r"\s*\(Mono\)",
-    r"\s*\(Stereo\)",
-    r"\s*\(Reworked\)",
-    r"\s*\(Single Version\)",
-    r"\s*\(Soundtrack Version\)",
-    r"\s*\([^)]*Mix\)",
-]
+    return _track_remapper.get(rating_key if isinstance(rating_key, str) else str(rating_key), _EMPTY)
+
+
+# Patterns to strip from titles (version/format info that doesn't affect song identity),
+# fused into one alternation so each title is scanned once
+_TITLE_STRIP_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in [
+            r"\s*\(Extended Version\)",
+            r"\s*\(\d{4}\s*-?\s*Remaster(?:ed)?\)",
+            r"\s*\(Remaster(?:ed)?\)",
+            r"\s*\(\d+(?:st|nd|rd|th) Anniversary Edition\)",
+            r"\s*\(Mono\)",
+            r"\s*\(Stereo\)",
+            r"\s*\(Reworked\)",
+            r"\s*\(Single Version\)",
+            r"\s*\(Soundtrack Version\)",
+            r"\s*\([^)]*Mix\)",
+        ]
+    ),
+    re.IGNORECASE,
+)
 
 # Patterns that indicate problematic versions (should warn, not strip)
 _TITLE_WARNING_PATTERNS = [
-    (r"\(Instrumental\)", "Instrumental version"),
-    (r"\(Live[^)]*\)", "Live version"),
+    (re.compile(pattern, re.IGNORECASE), warning_msg)
+    for pattern, warning_msg in [
+        (r"\(Instrumental\)", "Instrumental version"),
+        (r"\(Live[^)]*\)", "Live version"),
+    ]
 ]
 
 
 def check_title_warnings(title: str) -> list[str]:
     """Check if title contains problematic version indicators. Returns list of warnings."""
+    # Every warning pattern needs a parenthesis; most titles have none
+    if "(" not in title:
+        return []
     warnings = []
     for pattern, warning_msg in _TITLE_WARNING_PATTERNS:
-        if re.search(pattern, title, re.IGNORECASE):
+        if pattern.search(title):
             warnings.append(warning_msg)
     return warnings
 
 
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
     """Remove version/format suffixes from title that don't affect song identity."""
     if not title:
         return title
-    result = title
-    for pattern in _TITLE_STRIP_PATTERNS:
-        result = re.sub(pattern, "", result, flags=re.IGNORECASE)
-    return result.strip()
+    # Every strip pattern needs a parenthesis; most titles have none
+    if "(" not in title:
+        return title.strip()
+    return _TITLE_STRIP_RE.sub("", title).strip()
+
+
+def load_json_file(path: Path):
+    """Load a JSON file, falling back to JSON5 for hand-edited files.
+
+    Generated files are plain JSON and go through the C-accelerated stdlib parser;
+    the much slower pure-Python json5 parser only runs if that fails
+    (comments, trailing commas, ...).
+    """
+    # json.loads detects the encoding of raw bytes (including a UTF-8 BOM left by
+    # Windows editors), so such files stay on the fast path
+    data = Path(path).read_bytes()
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        return json5.loads(data.decode("utf-8-sig"))
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Write text to path via a synced temp file + rename, so a crash never leaves a truncated file."""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json_file(path: Path, data, indent: int = 2, ensure_ascii: bool = True) -> None:
+    """Write data as JSON atomically (temp file + rename), so a crash never leaves a truncated file."""
+    _write_text_atomic(path, json.dumps(data, indent=indent, ensure_ascii=ensure_ascii))
+
+
+def write_remapper_file(path: Path, remapper: list) -> None:
+    """Write the track remapper atomically in its hand-edited format (4-space indent, UTF-8, trailing newline)."""
+    _write_text_atomic(path, json.dumps(remapper, indent=4, ensure_ascii=False) + "\n")
 
 
 def load_plex_config(config_path: Path) -> dict:
@@ -324,7 +383,15 @@ def load_plex_config(config_path: Path) -> dict:
 
     Returns dict with keys: serverUrl, token, files_path, csv_files_path, remapper_path,
     manifest_path, game_registry_path
+
+    The file is parsed once per process; the returned dict is shared and must not be modified.
     """
+    return _load_plex_config(Path(config_path).resolve())
+
+
+@lru_cache(maxsize=8)
+def _load_plex_config(config_path: Path) -> dict:
+    """Load and parse plex-config.json (cached by resolved path, see load_plex_config)."""
     if not config_path.exists():
         return {}
     try:
@@ -368,13 +435,28 @@ def load_plex_config(config_path: Path) -> dict:
         return {}
 
 
+# Shared session so all Plex requests (including from worker threads) reuse
+# keep-alive connections instead of doing a new TCP/TLS handshake per call
+_SESSION = requests.Session()
+_PLEX_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], raise_on_status=False),
+)
+_SESSION.mount("http://", _PLEX_ADAPTER)
+_SESSION.mount("https://", _PLEX_ADAPTER)
+_SESSION.headers["Accept"] = "application/json"
+
+
 def plex_request(url: str, token: str) -> dict:
     """Make a request to the Plex API."""
-    headers = {"Accept": "application/json"}
-    params = {"X-Plex-Token": token}
-    response = requests.get(url, headers=headers, params=params, timeout=30)
-    response.raise_for_status()
-    return response.json()
+    # The token goes with each request (not onto the shared session), so threads using
+    # different servers/tokens never race on session state; only the connection pool is shared
+    response = _SESSION.get(url, headers={"X-Plex-Token": token}, timeout=30)
+    if response.status_code >= 400:
+        response.raise_for_status()
+    # Decode the raw bytes directly; response.json() goes through .text and its charset detection
+    return json.loads(response.content)
 
 
 def extract_guids(track: dict) -> tuple[str | None, str | None]:
@@ -387,15 +469,122 @@ def extract_guids(track: dict) -> tuple[str | None, str | None]:
 
     # MusicBrainz ID is in the Guid array (e.g., {"id": "mbid://..."})
     mbid = None
-    for guid_entry in track.get("Guid", []):
-        guid_id = guid_entry.get("id", "")
-        if guid_id.startswith("mbid://"):
+    for guid_entry in track.get("Guid") or ():
+        guid_id = guid_entry.get("id")
+        if guid_id and guid_id[:7] == "mbid://":
             mbid = guid_id[7:]  # Strip "mbid://" prefix
             break
 
     return plex_guid, mbid
 
 
+def _print_track_debug(result: dict, plex_year, plex_artist: str, plex_title: str, remapped_title: str) -> None:
+    """Print the debug summary for a built track, noting remapped and normalized fields."""
+    year_info = f"{result['year']}"
+    if result['year'] != plex_year:
+        year_info += f" (remapped from {plex_year})"
+    artist_info = result['artist']
+    if result['artist'] != plex_artist:
+        artist_info += f" (remapped from {plex_artist})"
+    title_info = result['title']
+    if result['title'] != remapped_title:
+        title_info += f" (normalized from {remapped_title})"
+    elif remapped_title != plex_title:
+        title_info += f" (remapped from {plex_title})"
+
+    lines = [f"DEBUG: Found: {artist_info} - {title_info} ({year_info})"]
+    if result.get("guid"):
+        lines.append(f"DEBUG: GUID: {result['guid']}")
+    if result.get("mbid"):
+        lines.append(f"DEBUG: MBID: {result['mbid']}")
+    if result.get("alternativeKeys"):
+        lines.append(f"DEBUG: Alternative key: {result['alternativeKeys'][0]}")
+    print("  " + "\n  ".join(lines))
+
+
+def build_plex_track(track: dict, rating_key: str, debug: bool = False) -> dict:
+    """Build a mapping entry from a Plex metadata item.
+
+    Applies remapper overrides, title normalization and alternativeKeys for the given
+    ratingKey. Returns dict with track info including 'warnings' list if problematic
+    version detected.
+    """
+    # One remapper lookup per track, using the ORIGINAL rating_key (not the fetch key)
+    remap = get_remap_entry(rating_key) if _track_remapper else _EMPTY
+    # Alternative ratingKey from the remapper: old printed cards may carry a different
+    # ratingKey, so it goes into alternativeKeys for the website to look up either one
+    alternative_key = remap.get("ratingKey")
+
+    media_list = track.get("Media")
+    media = media_list[0] if media_list else _EMPTY
+    parts_list = media.get("Part")
+    parts = parts_list[0] if parts_list else _EMPTY
+
+    plex_year = track.get("parentYear") or track.get("year")
+    plex_artist = track.get("grandparentTitle") or track.get("originalTitle")
+    plex_title = track.get("title")
+    # Apply remapper overrides
+    if remap:
+        remapped_year = remap.get("year", plex_year)
+        remapped_artist = remap.get("artist", plex_artist)
+        remapped_title = remap.get("title", plex_title)
+    else:
+        # Track not remapped (the common case): nothing to override
+        remapped_year, remapped_artist, remapped_title = plex_year, plex_artist, plex_title
+
+    # Check for problematic versions before normalizing
+    warnings = check_title_warnings(remapped_title)
+
+    # Normalize title (remove version suffixes)
+    normalized_title = normalize_title(remapped_title)
+
+    # Extract stable identifiers
+    plex_guid, mbid = extract_guids(track)
+
+    result = {
+        "ratingKey": rating_key,
+        "title": normalized_title,
+        "artist": remapped_artist,
+        "album": track.get("parentTitle"),
+        "year": remapped_year,
+        "duration": track.get("duration"),
+        "partKey": parts.get("key"),
+    }
+
+    # Add alternativeKeys from remapper (for old cards that have different ratingKey)
+    if alternative_key:
+        result["alternativeKeys"] = [alternative_key]
+
+    # Add stable identifiers if available
+    if plex_guid:
+        result["guid"] = plex_guid
+    if mbid:
+        result["mbid"] = mbid
+
+    if warnings:
+        result["warnings"] = warnings
+
+    if debug:
+        _print_track_debug(result, plex_year, plex_artist, plex_title, remapped_title)
+
+    return result
+
+
+def fetch_plex_metadata(server_url: str, token: str, rating_keys: list[str]) -> dict[str, dict]:
+    """Fetch metadata for several ratingKeys in one request.
+
+    Plex accepts a comma-separated key list on /library/metadata and returns
+    only the items it found. Returns dict of ratingKey -> metadata item.
+
+    HTTP errors (including a 404 for the whole list) are raised, so callers can
+    fall back to per-key requests instead of treating every key as missing.
+    """
+    url = f"{server_url}/library/metadata/{','.join(rating_keys)}"
+    response = plex_request(url, token)
+    metadata = response.get("MediaContainer", {}).get("Metadata", [])
+    return {str(item.get("ratingKey")): item for item in metadata}
+
+
 def fetch_plex_track(server_url: str, token: str, rating_key: str, debug: bool = False) -> dict | None:
     """Fetch track metadata directly by ratingKey.
 
@@ -404,9 +593,6 @@ def fetch_plex_track(server_url: str, token: str, rating_key: str, debug: bool =
 
     Returns dict with track info including 'warnings' list if problematic version detected.
     """
-    # Check if there's an alternative ratingKey in the remapper (for old cards)
-    alternative_key = get_alternative_ratingkey(rating_key)
-
     try:
         url = f"{server_url}/library/metadata/{rating_key}"
         if debug:
@@ -418,71 +604,7 @@ def fetch_plex_track(server_url: str, token: str, rating_key: str, debug: bool =
         if not metadata:
             return None
 
-        track = metadata[0]
-        media = track.get("Media", [{}])[0]
-        parts = media.get("Part", [{}])[0]
-
-        plex_year = track.get("parentYear") or track.get("year")
-        plex_artist = track.get("grandparentTitle") or track.get("originalTitle")
-        plex_title = track.get("title")
-        # Apply remapper overrides using the ORIGINAL rating_key (not the fetch key)
-        remapped_year = get_remapped_year(rating_key, plex_year)
-        remapped_artist = get_remapped_artist(rating_key, plex_artist)
-        remapped_title = get_remapped_title(rating_key, plex_title)
-
-        # Check for problematic versions before normalizing
-        warnings = check_title_warnings(remapped_title)
-
-        # Normalize title (remove version suffixes)
-        normalized_title = normalize_title(remapped_title)
-
-        # Extract stable identifiers
-        plex_guid, mbid = extract_guids(track)
-
-        result = {
-            "ratingKey": rating_key,
-            "title": normalized_title,
-            "artist": remapped_artist,
-            "album": track.get("parentTitle"),
-            "year": remapped_year,
-            "duration": track.get("duration"),
-            "partKey": parts.get("key"),
-        }
-
-        # Add alternativeKeys from remapper (for old cards that have different ratingKey)
-        if alternative_key:
-            result["alternativeKeys"] = [alternative_key]
-
-        # Add stable identifiers if available
-        if plex_guid:
-            result["guid"] = plex_guid
-        if mbid:
-            result["mbid"] = mbid
-
-        if warnings:
-            result["warnings"] = warnings
-
-        if debug:
-            year_info = f"{result['year']}"
-            if remapped_year != plex_year:
-                year_info += f" (remapped from {plex_year})"
-            artist_info = result['artist']
-            if remapped_artist != plex_artist:
-                artist_info += f" (remapped from {plex_artist})"
-            title_info = result['title']
-            if normalized_title != remapped_title:
-                title_info += f" (normalized from {remapped_title})"
-            elif remapped_title != plex_title:
-                title_info += f" (remapped from {plex_title})"
-            print(f"  DEBUG: Found: {artist_info} - {title_info} ({year_info})")
-            if plex_guid:
-                print(f"  DEBUG: GUID: {plex_guid}")
-            if mbid:
-                print(f"  DEBUG: MBID: {mbid}")
-            if alternative_key:
-                print(f"  DEBUG: Alternative key: {alternative_key}")
-
-        return result
+        return build_plex_track(metadata[0], rating_key, debug)
 
     except Exception as e:
         if debug:
@@ -490,6 +612,35 @@ def fetch_plex_track(server_url: str, token: str, rating_key: str, debug: bool =
         return None
 
 
+def fetch_plex_tracks(
+    server_url: str, token: str, rating_keys: list[str], workers: int = 8, debug: bool = False
+) -> Iterator[dict | None]:
+    """Fetch several tracks by ratingKey in parallel.
+
+    Yields one fetch_plex_track result per key, in the order of rating_keys,
+    as soon as that key (and all keys before it) have been fetched. Keys that
+    appear more than once are fetched once and share the result.
+
+    With workers=1 each key is fetched lazily on the calling thread when its
+    result is requested, so debug output stays next to the caller's own output.
+    """
+    if workers <= 1:
+        fetched = {}
+        for key in rating_keys:
+            if key not in fetched:
+                fetched[key] = fetch_plex_track(server_url, token, key, debug)
+            yield fetched[key]
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for key in rating_keys:
+            if key not in futures:
+                futures[key] = executor.submit(fetch_plex_track, server_url, token, key, debug)
+        for key in rating_keys:
+            yield futures[key].result()
+
+
 def list_plex_playlists(server_url: str, token: str, debug: bool = False) -> list[dict]:
     """List all audio playlists from Plex server."""
     try:
@@ -501,16 +652,15 @@ def list_plex_playlists(server_url: str, token: str, debug: bool = False) -> lis
         playlists = response.get("MediaContainer", {}).get("Metadata", [])
 
         # Filter to audio playlists only
-        audio_playlists = []
-        for playlist in playlists:
-            if playlist.get("playlistType") == "audio":
-                audio_playlists.append({
-                    "ratingKey": playlist.get("ratingKey"),
-                    "title": playlist.get("title"),
-                    "leafCount": playlist.get("leafCount", 0),
-                })
-
-        return audio_playlists
+        return [
+            {
+                "ratingKey": playlist.get("ratingKey"),
+                "title": playlist.get("title"),
+                "leafCount": playlist.get("leafCount", 0),
+            }
+            for playlist in playlists
+            if playlist.get("playlistType") == "audio"
+        ]
 
     except Exception as e:
         if debug:
@@ -528,13 +678,8 @@ def get_playlist_tracks(server_url: str, token: str, playlist_key: str, debug: b
         response = plex_request(url, token)
         items = response.get("MediaContainer", {}).get("Metadata", [])
 
-        rating_keys = []
-        for item in items:
-            key = item.get("ratingKey")
-            if key:
-                rating_keys.append(key)
-
-        return rating_keys
+        # Only the ratingKeys are needed; drop the rest of each item right away
+        return [key for item in items if (key := item.get("ratingKey"))]
 
     except Exception as e:
         if debug:
@@ -598,9 +743,7 @@ def create_playlist(
 
         # Create the playlist
         url = f"{server_url}/playlists"
-        headers = {"Accept": "application/json"}
         params = {
-            "X-Plex-Token": token,
             "type": "audio",
             "title": title,
             "smart": "0",
@@ -612,7 +755,7 @@ def create_playlist(
             print(f"  DEBUG: Title: {title}")
             print(f"  DEBUG: Tracks: {len(rating_keys)}")
 
-        response = requests.post(url, headers=headers, params=params, timeout=30)
+        response = _SESSION.post(url, params=params, headers={"X-Plex-Token": token}, timeout=30)
         response.raise_for_status()
 
         result = response.json()
@@ -17,15 +17,28 @@ Usage:
 
 import argparse
 import json
+import random
+import re
+import sqlite3
 import sys
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from urllib.parse import quote
 
-import json5
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .plex_api import normalize_for_comparison, resolve_path, resolve_plex_credentials
+from .plex_api import (
+    load_json_file,
+    normalize_for_comparison,
+    resolve_path,
+    resolve_plex_credentials,
+    write_json_file,
+    write_remapper_file,
+)
 
 
 MUSICBRAINZ_API = "https://musicbrainz.org/ws/2"
@@ -33,43 +46,154 @@ USER_AGENT = "SongSeeker-YearValidator/1.0 (https://github.com/andygruber/songse
 RATE_LIMIT_DELAY = 1.5  # MusicBrainz requires max 1 request per second, use 1.5 for safety
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 2  # Base delay for exponential backoff
+BREAKER_THRESHOLD = 10  # Stop after this many MusicBrainz searches failed in a row
+PARTIAL_REPORT_EVERY = 10  # Rewrite the partial report after this many new discrepancies
+
+CACHE_TTL_DAYS = 30  # Cached MusicBrainz searches older than this are fetched again
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "songseeker"
+
+# Shared session so MusicBrainz requests reuse the keep-alive connection.
+# Only connection failures are retried here; 429/503 are handled in _do_musicbrainz_search
+# so they go through the rate limiter.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5),
+))
+_SESSION.headers.update({"User-Agent": USER_AGENT, "Accept": "application/json"})
+
+# Monotonic time of the last MusicBrainz request (for rate limiting)
+_last_request_time = 0.0
+
+# MusicBrainz searches that failed (retries exhausted) in a row, for the circuit breaker
+_consecutive_failures = 0
+
+# On-disk cache of MusicBrainz search results (None = caching disabled)
+_search_cache: sqlite3.Connection | None = None
+_refresh_cache = False
+
+
+def open_search_cache(cache_dir: Path, refresh: bool = False) -> None:
+    """Open (or create) the MusicBrainz search cache in cache_dir.
+
+    With refresh=True cached results are ignored, but fresh results are still stored.
+    """
+    global _search_cache, _refresh_cache
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _search_cache = sqlite3.connect(cache_dir / "musicbrainz-cache.sqlite")
+    _search_cache.execute(
+        "CREATE TABLE IF NOT EXISTS searches (query TEXT PRIMARY KEY, fetched_at INTEGER, results TEXT)"
+    )
+    _refresh_cache = refresh
+
+
+def get_cached_search(query: str) -> list[dict] | None:
+    """Return cached results for a search query, or None if not cached (or expired)."""
+    if _search_cache is None or _refresh_cache:
+        return None
+    row = _search_cache.execute(
+        "SELECT fetched_at, results FROM searches WHERE query = ?", (query,)
+    ).fetchone()
+    if row is None or time.time() - row[0] > CACHE_TTL_DAYS * 86400:
+        return None
+    return json.loads(row[1])
+
+
+def store_cached_search(query: str, results: list[dict]) -> None:
+    """Store the results of a successful search query in the cache."""
+    if _search_cache is None:
+        return
+    with _search_cache:
+        _search_cache.execute(
+            "INSERT OR REPLACE INTO searches (query, fetched_at, results) VALUES (?, ?, ?)",
+            (query, int(time.time()), json.dumps(results)),
+        )
+
+
+def wait_for_rate_limit() -> None:
+    """Sleep only as long as needed to keep RATE_LIMIT_DELAY between MusicBrainz requests.
+
+    Time spent on the previous request and on processing its results counts
+    towards the delay, instead of always sleeping the full interval.
+    """
+    global _last_request_time
+    remaining = _last_request_time + RATE_LIMIT_DELAY - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+    _last_request_time = time.monotonic()
+
+
+def postpone_next_request(seconds: float) -> None:
+    """Make wait_for_rate_limit hold the next request back for at least `seconds` from now."""
+    global _last_request_time
+    _last_request_time = max(_last_request_time, time.monotonic() + seconds - RATE_LIMIT_DELAY)
+
+
+def retry_after_seconds(response: requests.Response) -> float | None:
+    """Return the delay requested by a Retry-After header (seconds or HTTP date), if any."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+_LUCENE_TABLE = str.maketrans({c: f"\\{c}" for c in r'+-&|!(){}[]^"~*?:\/'})
 
 
 def escape_lucene(text: str) -> str:
     """Escape special Lucene characters in search query."""
-    special_chars = r'+-&|!(){}[]^"~*?:\/'
-    for char in special_chars:
-        text = text.replace(char, f"\\{char}")
-    return text
+    return text.translate(_LUCENE_TABLE)
 
 
 def _do_musicbrainz_search(query: str, debug: bool = False) -> list[dict]:
-    """Execute a single MusicBrainz search query with retry logic."""
+    """Execute a single MusicBrainz search query with retry logic (served from cache if possible)."""
+    global _consecutive_failures
+    cached = get_cached_search(query)
+    if cached is not None:
+        if debug:
+            print(f"  -> Using cached results ({len(cached)})")
+        return cached
+
     url = f"{MUSICBRAINZ_API}/recording"
     params = {
         "query": query,
         "fmt": "json",
         "limit": 100,
     }
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "application/json",
-    }
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
-
-            if response.status_code == 503:
-                retry_delay = RETRY_BASE_DELAY * (2 ** attempt)
+            wait_for_rate_limit()
+            response = _SESSION.get(url, params=params, timeout=30)
+
+            if response.status_code in (429, 503):
+                # Wait as long as the server asks for; otherwise back off exponentially with jitter
+                retry_delay = retry_after_seconds(response)
+                if retry_delay is None:
+                    retry_delay = RETRY_BASE_DELAY * (2 ** attempt) * random.uniform(1, 1.5)
                 if debug:
-                    print(f"  [!] Rate limited (503), waiting {retry_delay}s before retry {attempt + 1}/{MAX_RETRIES}")
+                    print(f"  [!] Rate limited ({response.status_code}), waiting {retry_delay:.1f}s before retry {attempt + 1}/{MAX_RETRIES}")
                 time.sleep(retry_delay)
                 continue
 
             response.raise_for_status()
             data = response.json()
 
+            # Out of requests for this window: hold the next one back until the reset time
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                try:
+                    postpone_next_request(float(response.headers["X-RateLimit-Reset"]) - time.time())
+                except (KeyError, ValueError):
+                    pass
+
             results = []
             for recording in data.get("recordings", []):
                 first_release = recording.get("first-release-date", "")
@@ -91,6 +215,8 @@ def _do_musicbrainz_search(query: str, debug: bool = False) -> list[dict]:
                     "mbid": recording.get("id", ""),
                 })
 
+            store_cached_search(query, results)
+            _consecutive_failures = 0
             return results
 
         except (requests.RequestException, ConnectionError) as e:
@@ -102,16 +228,24 @@ def _do_musicbrainz_search(query: str, debug: bool = False) -> list[dict]:
             else:
                 print(f"  [!] MusicBrainz API error after {MAX_RETRIES} retries: {e}", file=sys.stderr)
 
+    _consecutive_failures += 1
     return []
 
 
-def search_musicbrainz(artist: str, title: str, debug: bool = False) -> list[dict]:
+def search_musicbrainz(
+    artist: str,
+    title: str,
+    debug: bool = False,
+    plex_year: int | None = None,
+    tolerance: int = 0,
+) -> list[dict]:
     """
     Search MusicBrainz for recordings matching artist and title.
     Does multiple searches to find original releases:
     1. Official singles/albums only (most likely to have original)
     2. General search with artist
-    3. Search for older recordings if needed
+    3. Search for older recordings if needed (skipped if plex_year is given
+       and the best match of searches 1-2 already agrees with it within tolerance)
     Returns combined deduplicated results.
     """
     artist_escaped = escape_lucene(artist)
@@ -123,6 +257,9 @@ def search_musicbrainz(artist: str, title: str, debug: bool = False) -> list[dic
     def add_results(new_results: list[dict]) -> None:
         for r in new_results:
             if r["mbid"] not in seen_mbids:
+                # Normalize once here so find_best_match only does lookups per candidate
+                r["title_norm"] = normalize_for_comparison(r["title"])
+                r["artist_norm"] = normalize_for_comparison(r["artist"])
                 all_results.append(r)
                 seen_mbids.add(r["mbid"])
 
@@ -139,7 +276,6 @@ def search_musicbrainz(artist: str, title: str, debug: bool = False) -> list[dic
     add_results(official_results)
 
     # Search 2: General search with artist (catches anything missed)
-    time.sleep(RATE_LIMIT_DELAY)
     general_query = f'artist:"{artist_escaped}" AND recording:"{title_escaped}"'
     general_results = _do_musicbrainz_search(general_query, debug)
     add_results(general_results)
@@ -154,9 +290,16 @@ def search_musicbrainz(artist: str, title: str, debug: bool = False) -> list[dic
 
     earliest_year = min(years)
 
+    # The matches so far already confirm the Plex year: no need to look for older recordings
+    if plex_year is not None:
+        best_match = find_best_match(artist, title, all_results)
+        if best_match and best_match["first_release_year"] and abs(plex_year - best_match["first_release_year"]) <= tolerance:
+            if debug:
+                print("  -> Plex year confirmed, skipping search for older recordings")
+            return all_results
+
     # Search 3: Look for recordings released BEFORE our current earliest
     if earliest_year > 1950:
-        time.sleep(RATE_LIMIT_DELAY)
         older_query = f'artist:"{artist_escaped}" AND recording:"{title_escaped}" AND firstreleasedate:[1900 TO {earliest_year - 1}]'
         if debug:
             print(f"  -> Searching for recordings before {earliest_year}...")
@@ -187,7 +330,7 @@ def find_best_match(plex_artist: str, plex_title: str, mb_results: list[dict], d
 
     for result in mb_results:
         # Check title match
-        mb_title_norm = normalize_for_comparison(result["title"])
+        mb_title_norm = result["title_norm"]
         if plex_title_norm != mb_title_norm:
             # Allow partial match for title, but require significant overlap
             # This handles cases like "Satisfaction" matching "(I Can't Get No) Satisfaction"
@@ -203,7 +346,7 @@ def find_best_match(plex_artist: str, plex_title: str, mb_results: list[dict], d
                 continue
 
         # Check artist match (more lenient)
-        mb_artist_norm = normalize_for_comparison(result["artist"])
+        mb_artist_norm = result["artist_norm"]
         artist_match = (
             plex_artist_norm in mb_artist_norm or
             mb_artist_norm in plex_artist_norm or
@@ -244,7 +387,41 @@ def find_best_match(plex_artist: str, plex_title: str, mb_results: list[dict], d
     return selected
 
 
-def validate_tracks(mapping: dict, tolerance: int = 0, limit: int | None = None, debug: bool = False, filter_str: str | None = None) -> list[dict]:
+# Album titles that suggest a compilation or re-release, whose year is often not the original one
+_RERELEASE_ALBUM_RE = re.compile(
+    r"\b(?:greatest hits|best of|collection|anthology|essentials?|remaster(?:ed)?|live|gold)\b",
+    re.IGNORECASE,
+)
+
+
+def suspicion_score(track: dict) -> int:
+    """Cheap estimate of how likely the Plex year of a track is wrong (higher = check first)."""
+    if not track:
+        return 0
+    score = 0
+    year = track.get("year")
+    if year and year > datetime.now().year:
+        score += 10
+    if _RERELEASE_ALBUM_RE.search(track.get("album") or ""):
+        score += 5
+    return score
+
+
+def save_report(path: Path, discrepancies: list[dict]) -> None:
+    """Write a discrepancy report (atomically, so an interrupted run never leaves a truncated file)."""
+    write_json_file(path, discrepancies, ensure_ascii=False)
+
+
+def validate_tracks(
+    mapping: dict,
+    tolerance: int = 0,
+    limit: int | None = None,
+    debug: bool = False,
+    filter_str: str | None = None,
+    breaker_threshold: int = BREAKER_THRESHOLD,
+    breaker_cooldown: float = 0,
+    partial_path: Path | None = None,
+) -> tuple[list[dict], bool]:
     """
     Validate years in a mapping dict against MusicBrainz.
 
@@ -254,9 +431,16 @@ def validate_tracks(mapping: dict, tolerance: int = 0, limit: int | None = None,
         limit: Max number of tracks to check (None = all)
         debug: Print debug info for each track
         filter_str: Only check tracks where artist or title contains this (case-insensitive)
+        breaker_threshold: Stop (or pause) after this many MusicBrainz searches failed in a row (0 = never)
+        breaker_cooldown: Seconds to pause before trying again once the breaker trips (0 = stop)
+        partial_path: Report file rewritten every PARTIAL_REPORT_EVERY discrepancies while the run goes on
+
+    Without a limit, likely wrong years (see suspicion_score) are checked first; with a limit
+    the tracks are checked in mapping order, so --limit always selects the same tracks.
 
     Returns:
-        List of discrepancies found
+        List of discrepancies found (in mapping order), and whether the run was interrupted
+        before all tracks were checked
     """
     # Apply filter if specified
     if filter_str:
@@ -267,9 +451,22 @@ def validate_tracks(mapping: dict, tolerance: int = 0, limit: int | None = None,
         }
         print(f"Filter '{filter_str}' matched {len(mapping)} tracks")
 
+    global _consecutive_failures
+
+    # Check likely wrong years first, so an interrupted run has already found the interesting ones.
+    # Results are reported in mapping order regardless.
+    position = {key: i for i, key in enumerate(mapping)}
+    if limit is None:
+        mapping = dict(sorted(mapping.items(), key=lambda item: -suspicion_score(item[1])))
+
+    def in_mapping_order() -> list[dict]:
+        return sorted(discrepancies, key=lambda d: position[d["ratingKey"]])
+
     discrepancies = []
+    interrupted = False
     checked = 0
     not_found = 0
+    next_progress = 0.0  # monotonic time of the next progress update
 
     total = len(mapping) if limit is None else min(limit, len(mapping))
 
@@ -277,83 +474,102 @@ def validate_tracks(mapping: dict, tolerance: int = 0, limit: int | None = None,
     print(f"Tolerance: ±{tolerance} year(s)")
     print()
 
-    for i, (rating_key, track) in enumerate(mapping.items()):
-        if limit and checked >= limit:
-            break
+    # Ctrl-C stops checking but still reports (and saves) the discrepancies found so far
+    try:
+        for i, (rating_key, track) in enumerate(mapping.items()):
+            if limit and checked >= limit:
+                break
+
+            # MusicBrainz keeps failing: stop instead of paying the full retry delays for every track,
+            # or pause and let a single failure trip the breaker again
+            if breaker_threshold and _consecutive_failures >= breaker_threshold:
+                if not breaker_cooldown:
+                    print(f"\nMusicBrainz failed {_consecutive_failures} searches in a row, stopping")
+                    interrupted = True
+                    break
+                print(f"\nMusicBrainz failed {_consecutive_failures} searches in a row, pausing {breaker_cooldown:g}s")
+                time.sleep(breaker_cooldown)
+                _consecutive_failures = breaker_threshold - 1
+
+            artist = track.get("artist", "")
+            title = track.get("title", "")
+            plex_year = track.get("year")
+
+            if not artist or not title or not plex_year:
+                continue
 
-        artist = track.get("artist", "")
-        title = track.get("title", "")
-        plex_year = track.get("year")
+            checked += 1
 
-        if not artist or not title or not plex_year:
-            continue
+            if debug:
+                print(f"[{checked}/{total}] Checking: {artist} - {title} ({plex_year})")
+            else:
+                # Progress indicator, at most twice per second (cached lookups finish much faster)
+                now = time.monotonic()
+                if now >= next_progress:
+                    print(f"  Progress: {checked}/{total}", end="\r", flush=True)
+                    next_progress = now + 0.5
 
-        checked += 1
+            # Query MusicBrainz
+            mb_results = search_musicbrainz(artist, title, debug=debug, plex_year=plex_year, tolerance=tolerance)
 
-        if debug:
-            print(f"[{checked}/{total}] Checking: {artist} - {title} ({plex_year})")
-        else:
-            # Progress indicator
-            if checked % 10 == 0:
-                print(f"  Progress: {checked}/{total}", end="\r")
+            if not mb_results:
+                not_found += 1
+                if debug:
+                    print(f"  -> No results found on MusicBrainz")
+                continue
 
-        # Query MusicBrainz
-        mb_results = search_musicbrainz(artist, title, debug=debug)
-        time.sleep(RATE_LIMIT_DELAY)  # Respect rate limit
+            # Find best match
+            best_match = find_best_match(artist, title, mb_results, debug=debug)
 
-        if not mb_results:
-            not_found += 1
-            if debug:
-                print(f"  -> No results found on MusicBrainz")
-            continue
+            if not best_match:
+                not_found += 1
+                if debug:
+                    print(f"  -> No matching result found (got {len(mb_results)} results but none matched)")
+                continue
 
-        # Find best match
-        best_match = find_best_match(artist, title, mb_results, debug=debug)
+            mb_year = best_match["first_release_year"]
 
-        if not best_match:
-            not_found += 1
-            if debug:
-                print(f"  -> No matching result found (got {len(mb_results)} results but none matched)")
-            continue
+            if not mb_year:
+                not_found += 1
+                if debug:
+                    print(f"  -> Match found but no year available")
+                continue
 
-        mb_year = best_match["first_release_year"]
+            year_diff = abs(plex_year - mb_year)
 
-        if not mb_year:
-            not_found += 1
             if debug:
-                print(f"  -> Match found but no year available")
-            continue
-
-        year_diff = abs(plex_year - mb_year)
-
-        if debug:
-            status = "✓" if year_diff <= tolerance else "✗"
-            print(f"  -> MusicBrainz: {best_match['artist']} - {best_match['title']} ({mb_year}) [{status}]")
-
-        if year_diff > tolerance:
-            discrepancy = {
-                "ratingKey": rating_key,
-                "artist": artist,
-                "title": title,
-                "album": track.get("album", ""),
-                "plex_year": plex_year,
-                "musicbrainz_year": mb_year,
-                "difference": mb_year - plex_year,
-                "musicbrainz_date": best_match["first_release_date"],
-                "musicbrainz_mbid": best_match["mbid"],
-            }
-            discrepancies.append(discrepancy)
+                status = "✓" if year_diff <= tolerance else "✗"
+                print(f"  -> MusicBrainz: {best_match['artist']} - {best_match['title']} ({mb_year}) [{status}]")
 
-            if not debug:
-                print(f"  MISMATCH: {artist} - {title}")
-                print(f"           Plex: {plex_year}, MusicBrainz: {mb_year} (diff: {mb_year - plex_year:+d})")
+            if year_diff > tolerance:
+                discrepancy = {
+                    "ratingKey": rating_key,
+                    "artist": artist,
+                    "title": title,
+                    "album": track.get("album", ""),
+                    "plex_year": plex_year,
+                    "musicbrainz_year": mb_year,
+                    "difference": mb_year - plex_year,
+                    "musicbrainz_date": best_match["first_release_date"],
+                    "musicbrainz_mbid": best_match["mbid"],
+                }
+                discrepancies.append(discrepancy)
+                if partial_path and len(discrepancies) % PARTIAL_REPORT_EVERY == 0:
+                    save_report(partial_path, in_mapping_order())
+
+                if not debug:
+                    print(f"  MISMATCH: {artist} - {title}")
+                    print(f"           Plex: {plex_year}, MusicBrainz: {mb_year} (diff: {mb_year - plex_year:+d})")
+    except KeyboardInterrupt:
+        interrupted = True
+        print("\nInterrupted, reporting the tracks checked so far")
 
     print()
     print(f"Checked: {checked} tracks")
     print(f"Not found on MusicBrainz: {not_found}")
     print(f"Discrepancies found: {len(discrepancies)}")
 
-    return discrepancies
+    return in_mapping_order(), interrupted
 
 
 def parse_args():
@@ -379,7 +595,7 @@ def parse_args():
     )
     parser.add_argument(
         "--limit", "-l", type=int,
-        help="Limit number of tracks to check (for testing)"
+        help="Limit number of tracks to check, in mapping order (for testing; without a limit suspicious years are checked first)"
     )
     parser.add_argument(
         "--output", "-o",
@@ -393,6 +609,30 @@ def parse_args():
         "--filter", "-f",
         help="Only check tracks where artist or title contains this string (case-insensitive)"
     )
+    parser.add_argument(
+        "--ignore-remapper", action="store_true",
+        help="Also check tracks whose year was already corrected in plex-remapper.json"
+    )
+    parser.add_argument(
+        "--breaker-threshold", type=int, default=BREAKER_THRESHOLD,
+        help=f"Stop after this many MusicBrainz searches failed in a row (default: {BREAKER_THRESHOLD}, 0 = never)"
+    )
+    parser.add_argument(
+        "--breaker-cooldown", type=float, default=0,
+        help="Pause this many seconds and try again instead of stopping when MusicBrainz keeps failing"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Directory for the MusicBrainz search cache (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Do not read or write the MusicBrainz search cache"
+    )
+    parser.add_argument(
+        "--refresh-cache", action="store_true",
+        help="Ignore cached MusicBrainz results and fetch them again"
+    )
     parser.add_argument(
         "--config",
         help="Path to plex-config.json"
@@ -402,8 +642,7 @@ def parse_args():
 
 def load_tracks_from_report(report_path: Path) -> dict:
     """Convert a report JSON back to a mapping-like structure for re-validation."""
-    with open(report_path, "r", encoding="utf-8") as f:
-        report = json5.load(f)
+    report = load_json_file(report_path)
 
     # Convert report entries to mapping format
     mapping = {}
@@ -419,14 +658,33 @@ def load_tracks_from_report(report_path: Path) -> dict:
     return mapping
 
 
+def skip_corrected_tracks(mapping: dict, remapper_path: Path) -> dict:
+    """Drop tracks whose year was already corrected in the remapper (and is applied in the mapping)."""
+    remapper = load_json_file(remapper_path)
+    fixed = {}
+    for entry in remapper:
+        if not isinstance(entry, dict):
+            continue
+        replace_data = entry.get("replaceData")
+        if entry.get("ratingKey") and isinstance(replace_data, dict) and "year" in replace_data:
+            fixed[entry["ratingKey"]] = replace_data["year"]
+    remaining = {
+        k: v for k, v in mapping.items()
+        if not v or v.get("ratingKey") not in fixed or fixed[v.get("ratingKey")] != v.get("year")
+    }
+    skipped = len(mapping) - len(remaining)
+    if skipped:
+        print(f"Skipping {skipped} tracks already corrected in {remapper_path.name}")
+    return remaining
+
+
 def apply_report_to_remapper(report_path: Path, remapper_path: Path, debug: bool = False) -> None:
     """
     Apply year corrections from a report to plex-remapper.json.
     Creates or updates entries based on ratingKey.
     """
     # Load report
-    with open(report_path, "r", encoding="utf-8") as f:
-        report = json5.load(f)
+    report = load_json_file(report_path)
 
     if not report:
         print("Report is empty, nothing to apply.")
@@ -434,8 +692,7 @@ def apply_report_to_remapper(report_path: Path, remapper_path: Path, debug: bool
 
     # Load existing remapper or start fresh
     if remapper_path.exists():
-        with open(remapper_path, "r", encoding="utf-8") as f:
-            remapper = json5.load(f)
+        remapper = load_json_file(remapper_path)
         print(f"Loaded {len(remapper)} existing entries from {remapper_path.name}")
     else:
         remapper = []
@@ -489,16 +746,18 @@ def apply_report_to_remapper(report_path: Path, remapper_path: Path, debug: bool
             if debug:
                 print(f"  Added: {artist} - {title} (year: {mb_year})")
 
-    # Save updated remapper
-    with open(remapper_path, "w", encoding="utf-8") as f:
-        json.dump(remapper, f, indent=4, ensure_ascii=False)
-        f.write("\n")
+    # Save updated remapper (left untouched if the report changed nothing)
+    if added or updated:
+        write_remapper_file(remapper_path, remapper)
 
     print(f"\nApplied {len(report)} entries from report:")
     print(f"  Added: {added}")
     print(f"  Updated: {updated}")
     print(f"  Unchanged: {len(report) - added - updated}")
-    print(f"\nSaved to: {remapper_path}")
+    if added or updated:
+        print(f"\nSaved to: {remapper_path}")
+    else:
+        print(f"\nNo changes, {remapper_path.name} not rewritten")
 
 
 def main():
@@ -522,9 +781,10 @@ def main():
         if not input_path.exists():
             print(f"Error: Mapping file not found: {input_path}", file=sys.stderr)
             sys.exit(1)
-        with open(input_path, "r", encoding="utf-8") as f:
-            mapping = json5.load(f)
+        mapping = load_json_file(input_path)
         print(f"Loaded {len(mapping)} tracks from mapping file")
+        if not args.ignore_remapper and args.remapper_path and args.remapper_path.exists():
+            mapping = skip_corrected_tracks(mapping, args.remapper_path)
     else:
         input_path = resolve_path(args, args.report)
         if not input_path.exists():
@@ -533,14 +793,6 @@ def main():
         mapping = load_tracks_from_report(input_path)
         print(f"Loaded {len(mapping)} tracks from previous report (re-checking)")
 
-    discrepancies = validate_tracks(
-        mapping,
-        tolerance=args.tolerance,
-        limit=args.limit,
-        debug=args.debug,
-        filter_str=args.filter,
-    )
-
     # Determine output path: explicit --output, or same as --report if used (but not with filter)
     output_path = None
     if args.output:
@@ -552,10 +804,40 @@ def main():
         print("\nNote: Not auto-saving when using --filter with --report (use --output to save)")
         output_path = None
 
+    # Partial results go to a separate file, so an interrupted run never replaces a full report
     if output_path:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(discrepancies, f, indent=2, ensure_ascii=False)
-        print(f"\nReport saved to: {output_path}")
+        partial_path = output_path.with_name(f"{output_path.stem}-partial{output_path.suffix}")
+    elif args.mapping:
+        partial_path = input_path.with_name(f"{input_path.stem}-years-partial.json")
+    else:
+        partial_path = None
+
+    if not args.no_cache:
+        open_search_cache(Path(args.cache_dir) if args.cache_dir else DEFAULT_CACHE_DIR, refresh=args.refresh_cache)
+
+    discrepancies, interrupted = validate_tracks(
+        mapping,
+        tolerance=args.tolerance,
+        limit=args.limit,
+        debug=args.debug,
+        filter_str=args.filter,
+        breaker_threshold=args.breaker_threshold,
+        breaker_cooldown=args.breaker_cooldown,
+        partial_path=partial_path,
+    )
+
+    if interrupted:
+        if partial_path:
+            save_report(partial_path, discrepancies)
+            print(f"\nRun was interrupted, partial report saved to: {partial_path}")
+        if output_path:
+            print(f"Not writing {output_path.name} (not all tracks were checked)")
+    else:
+        if output_path:
+            save_report(output_path, discrepancies)
+            print(f"\nReport saved to: {output_path}")
+        if partial_path:
+            partial_path.unlink(missing_ok=True)
 
     if discrepancies:
         print("\n--- Summary of Discrepancies ---")
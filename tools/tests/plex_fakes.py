@@ -0,0 +1,30 @@
+"""Fake Plex HTTP responses for the plex_mapper tests."""
+
+import json
+
+import requests
+
+
+def make_response(url: str, status: int, payload: dict | None = None) -> requests.Response:
+    """Build a requests.Response with a JSON body, as returned by the Plex API."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response._content = json.dumps(payload or {}).encode()
+    return response
+
+
+def fake_plex_get(library: dict[str, dict], batch_status: int = 404):
+    """Return a stand-in for Session.get that serves /library/metadata from library.
+
+    Batched (comma-separated) lookups never find anything, as a misbehaving server would:
+    they answer batch_status with an empty MediaContainer.
+    """
+    def get(url, **kwargs):
+        keys = url.rsplit("/library/metadata/", 1)[1]
+        if "," in keys:
+            return make_response(url, batch_status, {"MediaContainer": {}})
+        if keys not in library:
+            return make_response(url, 404)
+        return make_response(url, 200, {"MediaContainer": {"Metadata": [library[keys]]}})
+    return get
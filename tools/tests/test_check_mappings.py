@@ -0,0 +1,27 @@
+import json
+from unittest import mock
+
+from plex_fakes import fake_plex_get
+
+from plex_mapper import plex_api
+from plex_mapper.check_mappings import check_mapping_against_plex
+
+
+def test_batch_404_does_not_mark_existing_tracks_missing(tmp_path):
+    mapping = {
+        "1": {"ratingKey": "101", "artist": "A", "title": "One"},
+        "2": {"ratingKey": "102", "artist": "B", "title": "Two"},
+        "3": {"ratingKey": "103", "artist": "C", "title": "Gone"},
+    }
+    mapping_path = tmp_path / "plex-mapping-test.json"
+    mapping_path.write_text(json.dumps(mapping))
+    library = {"101": {"ratingKey": "101"}, "102": {"ratingKey": "102"}}
+
+    with mock.patch.object(plex_api._SESSION, "get", side_effect=fake_plex_get(library)):
+        total, missing = check_mapping_against_plex("http://plex", "token", mapping_path, fix=True)
+
+    assert (total, missing) == (3, 1)
+    saved = json.loads(mapping_path.read_text())
+    assert "missing" not in saved["1"]
+    assert "missing" not in saved["2"]
+    assert saved["3"]["missing"] is True
@@ -0,0 +1,42 @@
+import json
+from unittest import mock
+
+import pytest
+
+from plex_fakes import fake_plex_get
+
+from plex_mapper import plex_api
+from plex_mapper.mapping_tools import enrich_mapping
+
+
+def plex_item(rating_key: str, title: str, year: int) -> dict:
+    return {
+        "ratingKey": rating_key,
+        "title": title,
+        "grandparentTitle": "Artist",
+        "parentTitle": "Album",
+        "year": year,
+        "Media": [{"Part": [{"key": f"/library/parts/{rating_key}/file.mp3"}]}],
+    }
+
+
+@pytest.mark.parametrize("batch_status", [404, 200])
+def test_failed_or_empty_batch_falls_back_to_per_key_lookups(tmp_path, capsys, batch_status):
+    mapping = {
+        "1": {"ratingKey": "101", "artist": "Artist", "title": "One", "year": 1970},
+        "2": {"ratingKey": "102", "artist": "Artist", "title": "Gone", "year": 1980},
+    }
+    mapping_path = tmp_path / "plex-mapping-test.json"
+    mapping_path.write_text(json.dumps(mapping))
+    library = {"101": plex_item("101", "One", 1971)}
+
+    with mock.patch.object(plex_api._SESSION, "get", side_effect=fake_plex_get(library, batch_status)):
+        enrich_mapping("http://plex", "token", mapping_path)
+
+    saved = json.loads(mapping_path.read_text())
+    assert saved["1"]["year"] == 1971
+    assert saved["1"]["partKey"] == "/library/parts/101/file.mp3"
+    assert saved["2"] == mapping["2"]
+    out = capsys.readouterr().out
+    assert "Missing:   1" in out
+    assert "MISSING: Artist - Gone" in out
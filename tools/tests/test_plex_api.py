@@ -0,0 +1,64 @@
+import json
+from unittest import mock
+
+import pytest
+
+from plex_fakes import make_response
+
+from plex_mapper import plex_api
+from plex_mapper.plex_api import write_json_file, write_remapper_file
+
+
+def test_write_json_file_replaces_atomically(tmp_path):
+    path = tmp_path / "plex-mapping-test.json"
+    path.write_text("old")
+
+    write_json_file(path, {"1": {"title": "One"}})
+
+    assert json.loads(path.read_text()) == {"1": {"title": "One"}}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_failed_write_keeps_original_and_removes_temp_file(tmp_path):
+    path = tmp_path / "plex-remapper.json"
+    path.write_text("[]\n")
+
+    with mock.patch.object(plex_api.os, "replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            write_remapper_file(path, [{"ratingKey": "1"}])
+
+    assert path.read_text() == "[]\n"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_load_track_remapper_skips_entries_without_replace_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(plex_api, "_track_remapper", {})
+    monkeypatch.setattr(plex_api, "_track_remapper_loaded", False)
+    remapper_path = tmp_path / "plex-remapper.json"
+    remapper_path.write_text(json.dumps([
+        {"ratingKey": "1", "replaceData": None},
+        {"ratingKey": "2"},
+        {"replaceData": {"year": 1980}},
+        {"ratingKey": "3", "replaceData": {"year": 1971}},
+    ]))
+
+    remapper = plex_api.load_track_remapper(remapper_path)
+
+    assert remapper == {"3": {"year": 1971}}
+    assert plex_api.get_remap_entry("1") == {}
+
+
+def test_plex_request_sends_token_per_request():
+    sent = []
+
+    def send(request, **kwargs):
+        sent.append(request)
+        return make_response(request.url, 200, {"MediaContainer": {}})
+
+    with mock.patch.object(plex_api._SESSION, "send", side_effect=send):
+        plex_api.plex_request("http://plex-a/library/sections", "token-a")
+        plex_api.plex_request("http://plex-b/library/sections", "token-b")
+
+    assert [r.headers["X-Plex-Token"] for r in sent] == ["token-a", "token-b"]
+    assert all(r.headers["Accept"] == "application/json" for r in sent)
+    assert "X-Plex-Token" not in plex_api._SESSION.headers
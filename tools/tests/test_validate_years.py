@@ -0,0 +1,159 @@
+import json
+import sys
+from unittest import mock
+
+import pytest
+
+from plex_mapper import validate_years
+from plex_mapper.validate_years import suspicion_score, validate_tracks
+
+
+def track(title: str, year: int, album: str = "Album") -> dict:
+    return {"ratingKey": title, "artist": "Artist", "title": title, "album": album, "year": year}
+
+
+def mb_result(title: str, year: int) -> dict:
+    return {
+        "title": title,
+        "artist": "Artist",
+        "first_release_year": year,
+        "first_release_date": str(year),
+        "score": 100,
+        "mbid": f"mbid-{title}",
+        "title_norm": title.lower(),
+        "artist_norm": "artist",
+    }
+
+
+def fake_search(mb_years: dict, interrupt_at: str | None = None):
+    """Stand-in for search_musicbrainz: title -> MusicBrainz year, Ctrl-C when reaching interrupt_at."""
+    checked = []
+
+    def search(artist, title, **kwargs):
+        if title == interrupt_at:
+            raise KeyboardInterrupt
+        checked.append(title)
+        return [mb_result(title, mb_years[title])]
+
+    return search, checked
+
+
+@pytest.mark.parametrize("album, year, expected", [
+    ("Abbey Road", 1969, 0),
+    ("The Very Best Of", 1969, 5),
+    ("Greatest Hits", 1969, 5),
+    ("Abbey Road (Remastered)", 1969, 5),
+    ("Live at Wembley", 1969, 5),
+    ("Goldfinger", 1969, 0),
+    ("Abbey Road", 9999, 10),
+    ("Best of", 9999, 15),
+])
+def test_suspicion_score(album, year, expected):
+    assert suspicion_score(track("Song", year, album)) == expected
+
+
+def test_suspicion_score_of_unmatched_card():
+    assert suspicion_score(None) == 0
+
+
+def test_suspicious_tracks_first_but_report_in_mapping_order():
+    mapping = {t["ratingKey"]: t for t in [track("A", 1990), track("B", 1990, "Greatest Hits"), track("C", 1990)]}
+    search, checked = fake_search({"A": 1980, "B": 1970, "C": 1975})
+
+    with mock.patch.object(validate_years, "search_musicbrainz", side_effect=search):
+        discrepancies, interrupted = validate_tracks(mapping)
+
+    assert checked == ["B", "A", "C"]
+    assert [d["ratingKey"] for d in discrepancies] == ["A", "B", "C"]
+    assert not interrupted
+
+
+def test_limit_keeps_mapping_order():
+    mapping = {t["ratingKey"]: t for t in [track("A", 1990), track("B", 1990, "Greatest Hits"), track("C", 1990)]}
+    search, checked = fake_search({"A": 1990, "B": 1990, "C": 1990})
+
+    with mock.patch.object(validate_years, "search_musicbrainz", side_effect=search):
+        validate_tracks(mapping, limit=2)
+
+    assert checked == ["A", "B"]
+
+
+def test_interrupted_run_keeps_discrepancies_found_so_far():
+    mapping = {t["ratingKey"]: t for t in [track("A", 1990), track("B", 1990), track("C", 1990)]}
+    search, checked = fake_search({"A": 1980, "B": 1990}, interrupt_at="C")
+
+    with mock.patch.object(validate_years, "search_musicbrainz", side_effect=search):
+        discrepancies, interrupted = validate_tracks(mapping)
+
+    assert interrupted
+    assert [d["ratingKey"] for d in discrepancies] == ["A"]
+
+
+@pytest.fixture
+def files_path(tmp_path, monkeypatch):
+    config_path = tmp_path / "plex-config.json"
+    config_path.write_text(json.dumps({"serverUrl": "http://plex", "token": "token", "files-path": str(tmp_path)}))
+    monkeypatch.setattr(sys, "argv", ["validate-years", "--config", str(config_path), "--no-cache"])
+    return tmp_path
+
+
+def run_main(*args) -> int:
+    sys.argv += list(args)
+    with pytest.raises(SystemExit) as exit_info:
+        validate_years.main()
+    return exit_info.value.code
+
+
+def test_interrupted_mapping_run_writes_partial_report(files_path):
+    mapping = {"1": track("A", 1990), "2": track("B", 1990)}
+    (files_path / "plex-mapping-test.json").write_text(json.dumps(mapping))
+    search, _ = fake_search({"A": 1980}, interrupt_at="B")
+
+    with mock.patch.object(validate_years, "search_musicbrainz", side_effect=search):
+        run_main("--mapping", "plex-mapping-test.json")
+
+    partial = json.loads((files_path / "plex-mapping-test-years-partial.json").read_text())
+    assert [d["title"] for d in partial] == ["A"]
+
+
+def test_interrupted_recheck_keeps_the_report(files_path):
+    report = [
+        {"ratingKey": title, "artist": "Artist", "title": title, "plex_year": 1990, "musicbrainz_year": 1980}
+        for title in ("A", "B")
+    ]
+    report_path = files_path / "report.json"
+    report_path.write_text(json.dumps(report))
+    search, _ = fake_search({"A": 1980}, interrupt_at="B")
+
+    with mock.patch.object(validate_years, "search_musicbrainz", side_effect=search):
+        run_main("--report", "report.json")
+
+    assert json.loads(report_path.read_text()) == report
+    partial = json.loads((files_path / "report-partial.json").read_text())
+    assert [d["title"] for d in partial] == ["A"]
+
+
+def test_completed_run_removes_partial_report(files_path):
+    mapping = {"1": track("A", 1990)}
+    (files_path / "plex-mapping-test.json").write_text(json.dumps(mapping))
+    (files_path / "plex-mapping-test-years-partial.json").write_text("[]")
+    search, _ = fake_search({"A": 1980})
+
+    with mock.patch.object(validate_years, "search_musicbrainz", side_effect=search):
+        run_main("--mapping", "plex-mapping-test.json")
+
+    assert not (files_path / "plex-mapping-test-years-partial.json").exists()
+
+
+def test_skip_corrected_tracks_tolerates_incomplete_remapper_entries(tmp_path):
+    remapper_path = tmp_path / "plex-remapper.json"
+    remapper_path.write_text(json.dumps([
+        {"replaceData": {"year": 1980}},
+        {"ratingKey": "B", "replaceData": None},
+        {"ratingKey": "A", "replaceData": {"year": 1990}},
+    ]))
+    mapping = {"1": track("A", 1990), "2": track("B", 1990), "3": None}
+
+    remaining = validate_years.skip_corrected_tracks(mapping, remapper_path)
+
+    assert list(remaining) == ["2", "3"]